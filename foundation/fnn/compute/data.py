@@ -218,6 +218,10 @@ class _VisualScan(VisualType, RecordingType):
     def unit_order(self):
         raise NotImplementedError()
 
+    @property
+    def data_link(self):
+        raise NotImplementedError()
+
     @rowproperty
     def key_video(self):
         return (fnn.Spec.VisualSpec & self.item).proj("height", "width", "resize_id", "rate_id").fetch1()
@@ -295,17 +299,73 @@ class _VisualScan(VisualType, RecordingType):
 
     @rowmethod
     def trial_stimuli(self, trial_ids):
-        key = self.key_video
-        rows = stimulus.ResizedVideo * recording.TrialVideo * recording.ResampledTrial
+        from collections import Counter
+
+        # unique videos, fetched once in order of first trial
+        video_ids, indexes, videos = self.trial_videos(trial_ids)
+        videos = iter(videos)
+
+        # videos held until their last trial
+        remaining = Counter(video_ids)
+        held = dict()
 
         # load trials
-        for trial_id in trial_ids:
-            video, index = (rows & key & {"trial_id": trial_id}).fetch1("video", "index")
-            yield video[index].astype(np.uint8)
+        for video_id, index in zip(video_ids, indexes):
+
+            if video_id not in held:
+                _video_id, held[video_id] = next(videos)
+                assert _video_id == video_id
+
+            yield held[video_id][index]
+
+            # release video after its last trial
+            remaining[video_id] -= 1
+            if not remaining[video_id]:
+                del held[video_id]
+
+    @rowmethod
+    def trial_videos(self, trial_ids):
+        """
+        Parameters
+        ----------
+        trial_ids : Sequence[str]
+            sequence of keys (foundation.recording.trial.Trial)
+
+        Returns
+        -------
+        list[str]
+            video_id of each trial
+        list[1D array]
+            [samples] -- video frame index of each trial
+        Iterator[tuple[str, 4D array]]
+            unique (video_id, [frames, height, width, channels] video), in order of first trial
+        """
+        from foundation.utils.prefetch import prefetch, thread_module
+
+        key = self.key_video
+
+        # trial videos and resampled flip indices
+        trials = recording.TrialVideo * recording.ResampledTrial & key & [{"trial_id": _} for _ in trial_ids]
+        trials = trials.fetch("trial_id", "video_id", "index")
+        trials = {trial_id: (video_id, index) for trial_id, video_id, index in zip(*trials)}
+
+        video_ids = [trials[trial_id][0] for trial_id in trial_ids]
+        indexes = [trials[trial_id][1] for trial_id in trial_ids]
+
+        def load(video_id):
+            rows = thread_module(stimulus).ResizedVideo & key & {"video_id": video_id}
+            return video_id, rows.fetch1("video").astype(np.uint8, copy=False)
+
+        # unique videos
+        videos = prefetch(load, list(dict.fromkeys(video_ids)), depth=8)
+
+        return video_ids, indexes, videos
 
     def _trial_traces(self, trial_ids, datatype):
         from foundation.recording.trace import TraceSet
         from foundation.recording.compute.standardize import StandardizedTraces
+        from foundation.utils.prefetch import prefetch, thread_module
+        from foundation.utils.precision import decode
 
         if datatype == "perspective":
             key = self.key_perspective
@@ -322,18 +382,27 @@ class _VisualScan(VisualType, RecordingType):
         else:
             raise ValueError(f"datatype `{datatype}` not recognized")
 
-        # trace standardization
-        transform = (StandardizedTraces & key).transform
-
         # trace order
         order = merge((TraceSet & key).members, order & key)
         order = order.fetch("traceset_index", order_by="trace_order")
 
-        # load trials
-        for trial_id in trial_ids:
+        # trace standardization, parameters in trace order
+        transform = (StandardizedTraces & key).transform.permute(order)
+
+        def load(trial_id):
+            rows = thread_module(recording).ResampledTraces & key & {"trial_id": trial_id}
+            traces = decode(rows.fetch1("traces"))
+
+            # reorder and cast into a float32 buffer (column chunks bound the cast temporary)
+            out = np.empty([traces.shape[0], order.size], dtype=np.float32)
+            for i in range(0, order.size, 1024):
+                np.take(traces, order[i : i + 1024], axis=1, out=out[:, i : i + 1024])
 
-            traces = (recording.ResampledTraces & key & {"trial_id": trial_id}).fetch1("traces")
-            yield transform(traces).astype(np.float32)[:, order]
+            # standardize in place
+            return transform(out, out=out)
+
+        # load trials
+        return prefetch(load, trial_ids)
 
     @rowmethod
     def trial_perspectives(self, trial_ids):
@@ -351,9 +420,10 @@ class _VisualScan(VisualType, RecordingType):
         return self._trial_traces(trial_ids, "unit")
 
     @rowproperty
-    def dataset(self):
-        from fnn.data import NpyFile, Dataset
+    def data_id(self):
+        return (self.data_link & self.item).fetch1("data_id")
 
+    def _trials(self):
         # tiers
         training_tier, validation_tier = self.key.fetch1("training_tier", "validation_tier")
         tier_keys = [{"tier_index": index} for index in [training_tier, validation_tier]]
@@ -367,31 +437,146 @@ class _VisualScan(VisualType, RecordingType):
         )
         trial_ids, tiers, samples = trials.fetch("trial_id", "tier_index", "samples", order_by="start")
 
-        # load trials
-        stimuli, perspectives, modulations, units = [], [], [], []
+        return trial_ids, tiers == training_tier, samples
+
+    def _components(self, precision=None):
+        # spec component of each modality, trial arrays depend only on the component and the trial
+        return {
+            "stimuli": dict(self.key_video),
+            "perspectives": dict(self.key_perspective, precision=precision),
+            "modulations": dict(self.key_modulation, precision=precision),
+            "units": dict(self.key_unit, precision=precision),
+        }
+
+    def _modality(self, name, trial_ids, precision=None):
+        from foundation.utils.precision import encode
+
+        if name == "stimuli":
+            # unique videos, indexed by each trial
+            video_ids, indexes, videos = self.trial_videos(trial_ids)
+            return ({name: _} for _ in zip(video_ids, indexes)), {name: videos}
+
+        datatype = {"perspectives": "perspective", "modulations": "modulation", "units": "unit"}[name]
+
+        # trace arrays held at storage precision
+        traces = self._trial_traces(trial_ids, datatype)
+        traces = tqdm(traces, total=len(trial_ids), desc=name.capitalize())
+
+        if precision is not None:
+            traces = (encode(_, precision) for _ in traces)
+
+        return ({name: _} for _ in traces), {}
+
+    def _file(self, a):
+        from fnn.data import NpyFile
+        from foundation.utils.precision import Decoded
+
+        if isinstance(a, tuple):
+            # frames gathered lazily from a shared source
+            source, index = a
+            return NpyFile(source, indexmap=index)
+
+        elif a.dtype == np.float16:
+            # upcast when loaded
+            return NpyFile(a, dtype=np.float32)
+
+        elif a.dtype == np.uint16:
+            # bfloat16 bits, decoded when loaded
+            return NpyFile(Decoded(a, dtype=np.float32))
+
+        else:
+            return NpyFile(a)
+
+    @rowproperty
+    def dataset(self):
+        from os import getenv, getpid, makedirs, path, replace
+        from fnn.data import Dataset
+        from foundation.utils.cache import TrialStore, key_hash
+
+        # storage precision of trace arrays, float32 buffers are kept as is
+        precision = (fnn.Spec.VisualSpec & self.item).fetch1("trace_precision")
+        precision = None if precision == "float32" else precision
+
+        # memory-mapped dataset cache, content-addressed by spec component and trial
+        root = getenv("FOUNDATION_DATA_CACHE")
 
-        for s, p, m, u in zip(
-            self.trial_stimuli(tqdm(trial_ids, desc="Trials")),
-            self.trial_perspectives(trial_ids),
-            self.trial_modulations(trial_ids),
-            self.trial_units(trial_ids),
-        ):
+        if root is None:
+            trial_ids, training, samples = self._trials()
 
-            stimuli.append(NpyFile(s))
-            perspectives.append(NpyFile(p))
-            modulations.append(NpyFile(m))
-            units.append(NpyFile(u))
+            arrays = dict()
+            for modality in self._components():
 
-        assert len(stimuli) == len(trial_ids)
+                trials, sources = self._modality(modality, trial_ids, precision)
+
+                # unique sources held once
+                sources = {name: dict(_) for name, _ in sources.items()}
+
+                for trial in trials:
+                    for name, a in trial.items():
+                        if name in sources:
+                            key, index = a
+                            a = (sources[name][key], index)
+                        arrays.setdefault(name, []).append(a)
+
+        else:
+            trial_ids, training, samples = self._trials()
+            components = {k: key_hash(dict(v, modality=k)) for k, v in self._components(precision).items()}
+
+            # manifest, addressed by the member trials and components -- rebuilt when either changes
+            members = key_hash(
+                dict(
+                    trial_ids=trial_ids.tolist(),
+                    training=training.tolist(),
+                    samples=samples.tolist(),
+                    components=components,
+                )
+            )
+            manifest = path.join(root, "data", f"{self.data_id}.{members}.npz")
+
+            if not path.exists(manifest):
+
+                for modality, component in components.items():
+
+                    # trials not yet built for this component
+                    store = TrialStore(path.join(root, "components", component))
+                    built = store.trial_ids
+                    missing = [i for i, trial_id in enumerate(trial_ids) if trial_id not in built]
+
+                    if missing:
+                        _trial_ids = [trial_ids[i] for i in missing]
+                        trials, sources = self._modality(modality, _trial_ids, precision)
+                        store.save(_trial_ids, samples[missing], trials, sources)
+
+                # manifest written atomically
+                makedirs(path.dirname(manifest), exist_ok=True)
+                tmp = f"{manifest}.{getpid()}.tmp.npz"
+                np.savez(
+                    tmp,
+                    trial_ids=np.array(trial_ids, dtype=str),
+                    training=np.array(training, dtype=bool),
+                    samples=np.array(samples, dtype=int),
+                    modalities=np.array(list(components), dtype=str),
+                    components=np.array(list(components.values()), dtype=str),
+                )
+                replace(tmp, manifest)
+
+            with np.load(manifest) as f:
+                trial_ids, training, samples, modalities, components = [
+                    f[k] for k in ["trial_ids", "training", "samples", "modalities", "components"]
+                ]
+
+            arrays = dict()
+            for component in components:
+                store = TrialStore(path.join(root, "components", component))
+                arrays.update(store.load(trial_ids))
+
+        assert all(len(a) == len(trial_ids) for a in arrays.values())
 
         # dataset
         data = {
-            "training": tiers == training_tier,
+            "training": training,
             "samples": samples,
-            "stimuli": stimuli,
-            "perspectives": perspectives,
-            "modulations": modulations,
-            "units": units,
+            **{name: [self._file(_) for _ in a] for name, a in arrays.items()},
         }
         data = pd.DataFrame(data, index=pd.Index(trial_ids, name="trial_id"))
         return Dataset(data)
@@ -415,6 +600,10 @@ class VisualScan(_VisualScan):
     def unit_order(self):
         return recording.ScanUnitOrder
 
+    @property
+    def data_link(self):
+        return fnn.Data.VisualScan
+
 
 @keys
 class VisualScanRaw(_VisualScan):
@@ -434,9 +623,13 @@ class VisualScanRaw(_VisualScan):
     def unit_order(self):
         return recording.ScanUnitRawOrder
 
+    @property
+    def data_link(self):
+        return fnn.Data.VisualScanRaw
+
 
 @keys
-class Sensorium2023(DataType):
+class Sensorium2023(VisualType):
     """Sensorium 2023"""
 
     @property
@@ -452,5 +645,147 @@ class Sensorium2023(DataType):
         return join("/mnt", "scratch09", "sensorium_2023", self.item["sensorium_dataset"])
 
     def trim(self, x, axis):
-        end = np.where(np.isnan(x))[axis].min()
+        nans = np.where(np.isnan(x))[axis]
+        end = nans.min() if nans.size else x.shape[axis]
         return np.take(x, np.arange(end), axis=axis)
+
+    def load(self, modality, trial_id):
+        """
+        Parameters
+        ----------
+        modality : str
+            "videos" | "responses" | "behavior" | "pupil_center"
+        trial_id : str
+            trial file name
+
+        Returns
+        -------
+        np.memmap
+            [..., frames] -- read-only memory-mapped trial array
+        """
+        from os.path import join
+
+        return np.load(join(self.root, "data", modality, f"{trial_id}.npy"), mmap_mode="r")
+
+    @rowproperty
+    def trials(self):
+        """
+        Returns
+        -------
+        pd.DataFrame
+            trial_id (index) -- trial file name
+            tier -- sensorium tier
+            training -- training | validation
+        """
+        from os.path import join
+
+        # trial tiers, indexed by trial file
+        tiers = np.load(join(self.root, "meta", "trials", "tiers.npy"))
+        trial_ids = np.arange(tiers.size).astype(str)
+
+        # training and validation trials
+        trainval = self.item["trainval_tiers"].split(",")
+        trainval = np.isin(tiers, [_.strip() for _ in trainval])
+
+        # random split -- split_fraction of trials for training
+        rng = np.random.default_rng(self.item["split_seed"])
+        order = rng.permutation(trainval.sum())
+        training = order < round(float(self.item["split_fraction"]) * order.size)
+
+        index = pd.Index(trial_ids[trainval], name="trial_id")
+        return pd.DataFrame({"tier": tiers[trainval], "training": training}, index=index)
+
+    @rowproperty
+    def first_trial(self):
+        return self.trials.index[0]
+
+    @rowproperty
+    def stimuli(self):
+        video = self.load("videos", self.first_trial)
+        return 1 if video.ndim == 3 else video.shape[2]
+
+    @rowproperty
+    def perspectives(self):
+        return self.load("pupil_center", self.first_trial).shape[0]
+
+    @rowproperty
+    def modulations(self):
+        return self.load("behavior", self.first_trial).shape[0]
+
+    @rowproperty
+    def units(self):
+        return self.load("responses", self.first_trial).shape[0]
+
+    @rowproperty
+    def perspective_offset(self):
+        # sampled on the video frame grid
+        return 0.0
+
+    @rowproperty
+    def modulation_offset(self):
+        # sampled on the video frame grid
+        return 0.0
+
+    @rowproperty
+    def unit_offset(self):
+        # sampled on the video frame grid
+        return 0.0
+
+    @rowproperty
+    def sampling_period(self):
+        return 1 / 30
+
+    @rowproperty
+    def resolution(self):
+        video = self.load("videos", self.first_trial)
+        return video.shape[0], video.shape[1]
+
+    def samples(self, trial_id):
+        """
+        Parameters
+        ----------
+        trial_id : str
+            trial file name
+
+        Returns
+        -------
+        int
+            number of frames before the nan padding
+        """
+        # one pixel across frames, read without loading the video
+        video = self.load("videos", trial_id)
+        pixel = video[(0,) * (video.ndim - 1)]
+        return self.trim(pixel, axis=0).size
+
+    @rowproperty
+    def dataset(self):
+        from fnn.data import NpyFile, Dataset
+
+        trials = self.trials
+
+        # lazily loaded trials -- [samples, ...] views of memory-mapped files
+        samples, stimuli, perspectives, modulations, units = [], [], [], [], []
+
+        for trial_id in tqdm(trials.index, desc="Trials"):
+
+            n = self.samples(trial_id)
+            video = self.load("videos", trial_id)[..., :n]
+            video = video[..., None, :] if video.ndim == 3 else video
+
+            samples.append(n)
+            stimuli.append(NpyFile(np.moveaxis(video, -1, 0)))
+            perspectives.append(NpyFile(self.load("pupil_center", trial_id)[:, :n].T))
+            modulations.append(NpyFile(self.load("behavior", trial_id)[:, :n].T))
+            units.append(NpyFile(self.load("responses", trial_id)[:, :n].T))
+
+        # dataset
+        data = {
+            "training": trials.training.values,
+            "samples": samples,
+            "stimuli": stimuli,
+            "perspectives": perspectives,
+            "modulations": modulations,
+            "units": units,
+        }
+        data = pd.DataFrame(data, index=trials.index)
+        return Dataset(data)
@@ -12,7 +12,7 @@ class InstanceType:
     """Instance"""
 
     @rowmethod
-    def instantiate(self, data_id, network_id):
+    def instantiate(self, data_id, network_id, device=None):
         """
         Parameters
         ----------
@@ -20,6 +20,8 @@ class InstanceType:
             key (foundation.fnn.data.Data)
         network_id : str
             key (foundation.fnn.network.Network)
+        device : "cuda" | "cpu" | None
+            training device -- FOUNDATION_DEVICE if None, and cuda if available if that is not set either
 
         Yields
         ------
@@ -57,26 +59,119 @@ class ParallelCycle(InstanceType):
         """
         return
 
+    @staticmethod
+    def _threads(size, device=None):
+        """
+        Parameters
+        ----------
+        size : int
+            distributed size
+        device : "cuda" | "cpu" | None
+            training device -- FOUNDATION_DEVICE if None, and cuda if available if that is not set either
+
+        Returns
+        -------
+        int | None
+            cpu threads per rank | None (one cuda device per rank)
+        """
+        from os import getenv, sched_getaffinity
+        from torch import cuda
+
+        if device is None:
+            device = getenv("FOUNDATION_DEVICE")
+
+        if device is None:
+            device = "cuda" if cuda.is_available() else "cpu"
+
+        if device == "cuda":
+            assert cuda.is_available(), "Cuda is not available"
+            assert cuda.device_count() >= size, "Insufficient cuda devices"
+            return
+
+        if device != "cpu":
+            raise ValueError(f"device `{device}` not recognized")
+
+        threads = len(sched_getaffinity(0)) // size
+        assert threads > 0, "Insufficient cpu cores"
+
+        logger.info(f"Training on cpu with {threads} threads per rank")
+        return threads
+
+    @staticmethod
+    def _dataset(data_id, main=False):
+        """
+        Parameters
+        ----------
+        data_id : str
+            key (foundation.fnn.data.Data)
+        main : bool
+            main rank
+
+        Returns
+        -------
+        fnn.data.Dataset
+            dataset, built once by the main rank of each data_id and memory-mapped by the other ranks
+        """
+        from foundation.fnn.data import Data
+        from torch.distributed import barrier
+
+        if main:
+            dataset = (Data & {"data_id": data_id}).link.compute.dataset
+            barrier()
+        else:
+            barrier()
+            dataset = (Data & {"data_id": data_id}).link.compute.dataset
+
+        return dataset
+
+    @rowmethod
+    def _instantiate(self, data_id, network_id, main=False, device="cuda"):
+        """
+        Parameters
+        ----------
+        network_id : str
+            key (foundation.fnn.network.Network)
+        data_id : str
+            key (foundation.fnn.data.Data)
+        main : bool
+            main rank
+        device : str
+            "cuda" | "cpu"
+        """
+        # dataset
+        dataset = self._dataset(data_id=data_id, main=main)
+
+        # train
+        for _ in self._train(dataset=dataset, data_id=data_id, network_id=network_id, main=main, device=device):
+            pass
+
     @rowmethod
-    def _instantiate(self, data_id, network_id, main=False):
+    def _train(self, dataset, data_id, network_id, main=False, device="cuda"):
         """
         Parameters
         ----------
+        dataset : fnn.data.Dataset
+            network dataset
         network_id : str
             key (foundation.fnn.network.Network)
         data_id : str
             key (foundation.fnn.data.Data)
         main : bool
             main rank
+        device : str
+            "cuda" | "cpu"
+
+        Yields
+        ------
+        int
+            training epoch, after its info and checkpoint are saved
         """
         from foundation.fnn.progress import ModelInfo, ModelCheckpoint, ModelLag, ModelDone
         from foundation.fnn.transfer import Transfer, TransferList
         from foundation.fnn.network import Network
         from foundation.fnn.model import Model
         from foundation.fnn.train import Train
-        from foundation.fnn.data import Data
         from foundation.utils import torch_rng
-        from torch import device
 
         # key
         instance_id = (self.instance_type & self.item).fetch1("instance_id")
@@ -87,7 +182,7 @@ class ParallelCycle(InstanceType):
             logger.info(f"Initializing parameters with random seed {self.item['seed']}")
 
             # initial network
-            network = (Network & {"network_id": network_id}).link.network(data_id=data_id).to(device="cuda")
+            network = (Network & {"network_id": network_id}).link.network(data_id=data_id).to(device=device)
 
             # transfer network
             if (TransferList & self.item).fetch1("members"):
@@ -115,11 +210,11 @@ class ParallelCycle(InstanceType):
             logger.info("Reloading from checkpoint")
 
             # reload parameters
-            parameters = (ModelCheckpoint & key).parameters(device="cuda")
+            parameters = (ModelCheckpoint & key).parameters(device=device)
             network.load_state_dict(parameters)
 
             # reload checkpoint
-            checkpoint = (ModelCheckpoint & key).checkpoint(device="cuda")
+            checkpoint = (ModelCheckpoint & key).checkpoint(device=device)
 
         elif self.item["cycle"]:
             logger.info("Reloading from previous cycle")
@@ -131,7 +226,7 @@ class ParallelCycle(InstanceType):
             prev = {"data_id": data_id, "network_id": network_id, "instance_id": prev}
 
             # reload parameters
-            parameters = (Model & prev).parameters(device="cuda")
+            parameters = (Model & prev).parameters(device=device)
             network.load_state_dict(parameters)
 
             # no checkpoint
@@ -146,9 +241,6 @@ class ParallelCycle(InstanceType):
         # parallel groups
         groups = network.parallel_groups(group_size=self.item["parallel"], shared=self.shared)
 
-        # dataset
-        dataset = (Data & {"data_id": data_id}).link.compute.dataset
-
         # train
         for epoch, info, checkpoint, parameters in (Train & self.item).link.compute.train(
             dataset=dataset,
@@ -169,6 +261,8 @@ class ParallelCycle(InstanceType):
                 # save checkpoint
                 ModelCheckpoint.fill(dict(key, epoch=epoch, checkpoint=checkpoint, parameters=parameters))
 
+            yield epoch
+
         if main:
             # register done
             ModelDone.insert1(key)
@@ -189,7 +283,7 @@ class Individual(ParallelCycle):
         return fnn.Instance.Individual
 
     @staticmethod
-    def _spawn(rank, size, data_id, network_id, instance_id, port=23456, backend="nccl"):
+    def _spawn(rank, size, data_id, network_id, instance_id, port=23456, threads=None):
         """
         Parameters
         ----------
@@ -205,23 +299,34 @@ class Individual(ParallelCycle):
             key (foundation.fnn.instance.Instance)
         port : int
             tcp port
-        backend : str
-            'nccl' | 'mpi' | 'gloo' | 'ucc'
+        threads : int | None
+            cpu threads per rank (gloo backend) | None (cuda device per rank, nccl backend)
         """
+        from contextlib import nullcontext
+        from datetime import timedelta
         from torch.cuda import device
         from torch.distributed import init_process_group
+        from foundation.utils import pin_threads
 
         # main rank
         main = rank == 0
 
-        # cuda device
-        with device(rank):
-            # distributed process group
+        if threads is None:
+            # cuda device
+            context, backend = device(rank), "nccl"
+        else:
+            # cpu threads
+            pin_threads(rank, threads)
+            context, backend = nullcontext(), "gloo"
+
+        with context:
+            # distributed process group, timeout long enough for the main rank to build the dataset
             init_process_group(
                 backend=backend,
                 init_method=f"tcp://0.0.0.0:{port}",
                 rank=rank,
                 world_size=size,
+                timeout=timedelta(hours=24),
             )
 
             # model instance
@@ -229,13 +334,18 @@ class Individual(ParallelCycle):
             instance = Individual & key
 
             # instantiate model
-            instance._instantiate(data_id=data_id, network_id=network_id, main=main)
+            instance._instantiate(
+                data_id=data_id,
+                network_id=network_id,
+                main=main,
+                device="cuda" if threads is None else "cpu",
+            )
 
     @rowmethod
-    def instantiate(self, data_id, network_id):
+    def instantiate(self, data_id, network_id, device=None):
         from random import randint
-        from torch.cuda import device_count
         from torch.multiprocessing import spawn
+        from foundation.utils import shared_data_cache
 
         # tcp port
         port = randint(10000, 60000)
@@ -243,23 +353,149 @@ class Individual(ParallelCycle):
         # parallel group size, instance_id
         parallel, instance_id = (fnn.Instance.Individual & self.item).fetch1("parallel", "instance_id")
 
-        # verify cuda devices
-        assert device_count() >= parallel, "Insufficient cuda devices"
+        # cuda device | cpu threads per rank
+        threads = self._threads(parallel, device)
 
-        # instantiate with multiprocessing
+        # instantiate with multiprocessing, dataset shared across ranks
         conn = self.key.connection
         conn.close()
-        spawn(
-            Individual._spawn,
-            args=(parallel, data_id, network_id, instance_id, port),
-            nprocs=parallel,
-            join=True,
-        )
+        with shared_data_cache():
+            spawn(
+                Individual._spawn,
+                args=(parallel, data_id, network_id, instance_id, port, threads),
+                nprocs=parallel,
+                join=True,
+            )
         conn.connect()
 
         # yield model
         yield data_id, network_id
 
+    @staticmethod
+    def _spawn_joint(rank, size, data_id, network_id, instance_ids, port=23456, threads=None):
+        """
+        Parameters
+        ----------
+        rank : int
+            distributed rank
+        size : int
+            distributed size
+        data_id : str
+            key (foundation.fnn.data.Data)
+        network_id : str
+            key (foundation.fnn.network.Network)
+        instance_ids : List[str]
+            keys (foundation.fnn.instance.Instance)
+        port : int
+            tcp port
+        threads : int | None
+            cpu threads per rank (gloo backend) | None (cuda device per rank, nccl backend)
+        """
+        from collections import deque
+        from contextlib import nullcontext
+        from datetime import timedelta
+        from torch.cuda import device
+        from torch.distributed import init_process_group
+        from foundation.utils import pin_threads
+
+        # main rank
+        main = rank == 0
+
+        if threads is None:
+            # cuda device
+            context, backend = device(rank), "nccl"
+        else:
+            # cpu threads
+            pin_threads(rank, threads)
+            context, backend = nullcontext(), "gloo"
+
+        with context:
+            # distributed process group, timeout long enough for the main rank to build the dataset
+            init_process_group(
+                backend=backend,
+                init_method=f"tcp://0.0.0.0:{port}",
+                rank=rank,
+                world_size=size,
+                timeout=timedelta(hours=24),
+            )
+
+            # dataset, shared by all networks
+            dataset = ParallelCycle._dataset(data_id=data_id, main=main)
+
+            # network trainers, in the same order on every rank
+            trainers = deque()
+            for instance_id in instance_ids:
+                instance = Individual & (fnn.Instance.Individual & {"instance_id": instance_id})
+                trainer = instance._train(
+                    dataset=dataset,
+                    data_id=data_id,
+                    network_id=network_id,
+                    main=main,
+                    device="cuda" if threads is None else "cpu",
+                )
+                trainers.append(trainer)
+
+            # train networks interleaved by epoch
+            while trainers:
+                trainer = trainers.popleft()
+                try:
+                    next(trainer)
+                    trainers.append(trainer)
+                except StopIteration:
+                    pass
+
+    def instantiate_joint(self, data_id, network_id, device=None):
+        """Trains the networks of multiple instances in the same processes, sharing one dataset
+
+        Parameters
+        ----------
+        data_id : str
+            key (foundation.fnn.data.Data)
+        network_id : str
+            key (foundation.fnn.network.Network)
+        device : "cuda" | "cpu" | None
+            training device -- FOUNDATION_DEVICE if None, and cuda if available if that is not set either
+
+        Yields
+        ------
+        str
+            data_id (foundation.fnn.data.Data)
+        str
+            network_id (foundation.fnn.network.Network)
+        str
+            instance_id (foundation.fnn.instance.Instance)
+        """
+        from random import randint
+        from torch.multiprocessing import spawn
+        from foundation.utils import shared_data_cache
+
+        # tcp port
+        port = randint(10000, 60000)
+
+        # parallel group size, instance_ids
+        parallel, instance_ids = (fnn.Instance.Individual & self.key).fetch("parallel", "instance_id")
+        assert len(set(parallel)) == 1, "Instances must have the same parallel group size"
+        parallel, instance_ids = int(parallel[0]), sorted(instance_ids)
+
+        # cuda device | cpu threads per rank
+        threads = self._threads(parallel, device)
+
+        # instantiate with multiprocessing, dataset shared across networks and ranks
+        conn = fnn.Instance.connection
+        conn.close()
+        with shared_data_cache():
+            spawn(
+                Individual._spawn_joint,
+                args=(parallel, data_id, network_id, instance_ids, port, threads),
+                nprocs=parallel,
+                join=True,
+            )
+        conn.connect()
+
+        # yield models
+        for instance_id in instance_ids:
+            yield data_id, network_id, instance_id
+
 
 @keys
 class Foundation(ParallelCycle):
@@ -286,7 +522,7 @@ class Foundation(ParallelCycle):
         return modules.fetch("module", order_by="moduleset_index").tolist()
 
     @staticmethod
-    def _spawn(rank, size, data_ids, network_id, instance_id, port=23456, backend="nccl"):
+    def _spawn(rank, size, data_ids, network_id, instance_id, port=23456, threads=None):
         """
         Parameters
         ----------
@@ -302,24 +538,35 @@ class Foundation(ParallelCycle):
             key (foundation.fnn.instance.Instance)
         port : int
             tcp port
-        backend : str
-            'nccl' | 'mpi' | 'gloo' | 'ucc'
+        threads : int | None
+            cpu threads per rank (gloo backend) | None (cuda device per rank, nccl backend)
         """
+        from contextlib import nullcontext
+        from datetime import timedelta
         from torch.cuda import device
         from torch.distributed import init_process_group
+        from foundation.utils import pin_threads
 
         # main rank
         parallel = (fnn.Instance.Foundation & {"instance_id": instance_id}).fetch1("parallel")
         main = rank % parallel == 0
 
-        # cuda device
-        with device(rank):
-            # distributed process group
+        if threads is None:
+            # cuda device
+            context, backend = device(rank), "nccl"
+        else:
+            # cpu threads
+            pin_threads(rank, threads)
+            context, backend = nullcontext(), "gloo"
+
+        with context:
+            # distributed process group, timeout long enough for the main rank to build the dataset
             init_process_group(
                 backend=backend,
                 init_method=f"tcp://0.0.0.0:{port}",
                 rank=rank,
                 world_size=size,
+                timeout=timedelta(hours=24),
             )
 
             # model instance
@@ -327,13 +574,18 @@ class Foundation(ParallelCycle):
             instance = Foundation & key
 
             # instantiate model
-            instance._instantiate(data_id=data_ids[rank], network_id=network_id, main=main)
+            instance._instantiate(
+                data_id=data_ids[rank // parallel],
+                network_id=network_id,
+                main=main,
+                device="cuda" if threads is None else "cpu",
+            )
 
     @rowmethod
-    def instantiate(self, data_id, network_id):
+    def instantiate(self, data_id, network_id, device=None):
         from random import randint
-        from torch.cuda import device_count
         from torch.multiprocessing import spawn
+        from foundation.utils import shared_data_cache
         from foundation.fnn.data import DataSet
         from foundation.fnn.progress import ModelCheckpoint
 
@@ -348,8 +600,8 @@ class Foundation(ParallelCycle):
         parallel, instance_id = (fnn.Instance.Foundation & self.item).fetch1("parallel", "instance_id")
         size = parallel * len(data_ids)
 
-        # verify cuda devices
-        assert device_count() >= size, "Insufficient cuda devices"
+        # cuda device | cpu threads per rank
+        threads = self._threads(size, device)
 
         # verify checkpoints
         checkpoint = ModelCheckpoint & {"network_id": network_id, "instance_id": instance_id}
@@ -358,15 +610,16 @@ class Foundation(ParallelCycle):
             assert data_ids == _data_ids, "Invalid checkpoint data_ids"
             assert len(epochs) == 1, "Invalid checkpoint epochs"
 
-        # instantiate with multiprocessing
+        # instantiate with multiprocessing, dataset shared across ranks
         conn = self.key.connection
         conn.close()
-        spawn(
-            Foundation._spawn,
-            args=(size, sorted(data_ids), network_id, instance_id, port),
-            nprocs=size,
-            join=True,
-        )
+        with shared_data_cache():
+            spawn(
+                Foundation._spawn,
+                args=(size, sorted(data_ids), network_id, instance_id, port, threads),
+                nprocs=size,
+                join=True,
+            )
         conn.connect()
 
         # yield models
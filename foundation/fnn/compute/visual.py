@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 from itertools import repeat
-from djutils import keys, rowmethod, cache_rowproperty
+from djutils import keys, rowmethod, rowproperty, cache_rowproperty
 from foundation.utils import tqdm, logger
 from foundation.virtual import utility, stimulus, recording, fnn
 
@@ -107,7 +107,10 @@ class VisualRecordingCorrelation:
         cc = (Correlation & self.item).link.correlation
         correlations = []
 
-        for i in tqdm(range(data.units), desc="Units"):
+        for i in tqdm(range(0, data.units, 1024), desc="Units"):
+
+            # chunk of units
+            units = slice(i, i + 1024)
 
             # unit targets and predictions
             unit_targ = []
@@ -116,22 +119,22 @@ class VisualRecordingCorrelation:
             for index, t, p in zip(trials, targs, preds):
 
                 # target and prediction trials
-                _unit_targ = Trials([_[:, i] for _ in t], index=index)
-                _unit_pred = Trials([_[:, i] for _ in p], index=index)
+                _unit_targ = Trials([_[:, units] for _ in t], index=index)
+                _unit_pred = Trials([_[:, units] for _ in p], index=index)
 
                 assert _unit_targ.matches(_unit_pred)
 
                 unit_targ.append(_unit_targ)
                 unit_pred.append(_unit_pred)
 
-            # concatenated targets and predictions
+            # concatenated targets and predictions -- [trials, samples, units]
             unit_targ = concatenate(*unit_targ, burnin=self.item["burnin"])
             unit_pred = concatenate(*unit_pred, burnin=self.item["burnin"])
 
-            # unit correlation
+            # unit correlations
             correlations.append(cc(unit_targ, unit_pred))
 
-        return np.array(correlations)
+        return np.concatenate(correlations)
 
 
 @keys
@@ -228,24 +231,22 @@ class VisualDirectionTuning:
             utility.Burnin,
         ]
 
-    @rowmethod
-    def tuning(self):
+    @rowproperty
+    def events(self):
         """
         Returns
         -------
         1D array
-            directions (degrees) -- [directions]
+            [events] -- discretized directions (degrees)
         2D array
-            response (STA) to directions -- [units X directions]
-        2D array
-            density of directions -- [units X directions]
+            [events, units] -- responses to directions
         """
         from foundation.stimulus.video import VideoSet
         from foundation.stimulus.compute.video import DirectionSet
         from foundation.utility.numeric import Precision
 
         # precision function
-        pstr = (Precision & self.item).link.string
+        rnd = (Precision & self.item).link.round
 
         # videos
         videos = (VideoSet & self.item).members
@@ -253,36 +254,41 @@ class VisualDirectionTuning:
         # directions
         directions = (DirectionSet & videos).df.groupby("video_id")
 
-        # response dataframe
-        dfs = []
+        # directions and responses
+        _directions = []
+        _responses = []
         for video_id, impulse in (VisualImpulse & self.item).impulse():
 
             # direction dataframe
             df = directions.get_group(video_id)
 
-            # direction response and discretization
-            df.loc[:, ["response"]] = df.apply(lambda x: impulse(x.onset, x.offset), axis=1)
-            df.loc[:, ["direction"]] = df.apply(lambda x: pstr(x.direction), axis=1)
+            # direction responses -- [events, units]
+            _directions.append(df.direction.values)
+            _responses.append(impulse.windows(df.onset.values, df.offset.values))
 
-            dfs.append(df)
+        return rnd(np.concatenate(_directions)), np.concatenate(_responses, axis=0)
 
-        df = pd.concat(dfs)
-        df = df.groupby("direction")["response"].agg(response=lambda x: np.stack(x, axis=1))
+    @rowmethod
+    def tuning(self):
+        """
+        Returns
+        -------
+        1D array
+            directions (degrees) -- [directions]
+        2D array
+            response (STA) to directions -- [units X directions]
+        2D array
+            density of directions -- [units X directions]
+        """
+        from foundation.utils.tuning import direction_sta
 
-        # compute density and response STA
-        df.loc[:, ["density"]] = df.apply(lambda x: np.isfinite(x.response).sum(axis=1), axis=1)
-        df.loc[:, ["response"]] = df.apply(lambda x: np.nansum(x.response, axis=1) / x.density, axis=1)
+        # direction events -- [events], [events, units]
+        directions, responses = self.events
 
-        # sort by direction
-        df.index = df.index.astype(float)
-        df = df.reset_index()
-        df = df.sort_values("direction")
+        # compute density and response STA -- [units, directions]
+        direction, response, density = direction_sta(directions, responses)
 
-        return (
-            df["direction"].values,
-            np.stack(df["response"], axis=1).astype(np.float32),
-            np.stack(df["density"], axis=1).astype(int),
-        )
+        return direction, response.astype(np.float32), density.astype(int)
 
 
 @keys
@@ -314,6 +320,7 @@ class VisualSpatialTuning:
         """
         from foundation.stimulus.video import VideoSet
         from foundation.stimulus.compute.video import SpatialSet
+        from foundation.utils.tuning import spatial_sta
 
         # videos
         videos = (VideoSet & self.item).members
@@ -335,14 +342,9 @@ class VisualSpatialTuning:
         # iterate spatial types
         for spatial_type, sdf in df.groupby("spatial_type"):
 
-            # compute density and STA
-            grids = np.stack(sdf.spatial_grid, axis=-1)
-            responses = np.stack(sdf.response, axis=-1)
-            masks = np.isfinite(responses)
-            densities = np.sum(grids[:, :, None] * masks, axis=-1)
-            stas = np.nansum(grids[:, :, None] * responses, axis=-1) / densities
-
-            stas = stas.astype(np.float32).transpose(2, 0, 1)
-            densities = densities.astype(np.float32).transpose(2, 0, 1)
+            # compute density and STA -- [units, height, width]
+            grids = np.stack(sdf.spatial_grid, axis=0)
+            responses = np.stack(sdf.response, axis=0)
+            stas, densities = spatial_sta(grids, responses)
 
             yield spatial_type, stas, densities
@@ -23,6 +23,7 @@ class VisualSpec:
     -> utility.Standardize.proj(standardize_id_perspective="standardize_id")
     -> utility.Standardize.proj(standardize_id_modulation="standardize_id")
     -> utility.Standardize.proj(standardize_id_unit="standardize_id")
+    trace_precision     : enum("float32", "float16", "bfloat16")    # storage precision of dataset traces
     """
 
 
@@ -107,13 +108,19 @@ class Sensorium2023(DataType):
     split_seed          : int unsigned  # split seed
     """
 
+    @rowproperty
+    def compute(self):
+        from foundation.fnn.compute.data import Sensorium2023
+
+        return Sensorium2023 & self
+
 
 # -- Data --
 
 
 @schema.link
 class Data:
-    links = [VisualScan, VisualScanRaw]
+    links = [VisualScan, VisualScanRaw, Sensorium2023]
     name = "data"
     comment = "fnn data"
 
@@ -29,7 +29,7 @@ class _VisualScanData:
         """
         from foundation.utility import standardize
         from foundation.stimulus import resize
-        from foundation.recording import trial, trace, scan, tier, stat, resample
+        from foundation.recording import trial, scan, tier, stat, resample
         from foundation.fnn.data import VisualScan, Data
 
         # filtered trials and traces
@@ -81,20 +81,24 @@ class _VisualScanData:
 
                     # traces
                     traceset = table & key
-                    traces = (trace.TraceSet & traceset).members
 
                     # stats
                     stats = (standardize.Standardize & _spec).link.summary_ids
-                    stats = [{"summary_id": _} for _ in stats]
 
-                    # populate traces
-                    stat.TraceSummary.populate(
-                        traces, filt_trials, stats, _spec, display_progress=True, reserve_jobs=True
-                    )
-                    resample.ResampledTraces.populate(
-                        traceset, all_trials, _spec, display_progress=True, reserve_jobs=True
+                    # summary key
+                    resample_id, offset_id, rate_id = _spec.fetch1("resample_id", "offset_id", "rate_id")
+                    stat_key = dict(
+                        traceset_id=traceset.fetch1("traceset_id"),
+                        trialset_id=filt_trials.fetch1("trialset_id"),
+                        resample_id=resample_id,
+                        offset_id=offset_id,
+                        rate_id=rate_id,
                     )
 
+                    # populate traces
+                    stat.TraceSummary.fill(stat_key, summary_ids=stats)
+                    resample.ResampledTraces.populate(traceset, _spec, display_progress=True, reserve_jobs=True)
+
             # insert
             key = dict(key, training_tier=training_tier, validation_tier=validation_tier)
             self.datatype.insert1(key, skip_duplicates=True)
@@ -182,9 +186,18 @@ class VisualScanIndividualModel:
             fnn.Instance.Individual,
         ]
 
-    def fill(self):
+    def fill(self, joint=False):
+        """
+        Parameters
+        ----------
+        joint : bool
+            train instances that differ only in seed jointly, sharing one dataset and set of processes
+        """
         from foundation.fnn.model import Model
 
+        if joint:
+            return self._fill_joint()
+
         for key in self.key:
 
             # instance parameters
@@ -206,6 +219,42 @@ class VisualScanIndividualModel:
                 _key = dict(key, instance_id=_instance_id)
                 Model.populate(_key, reserve_jobs=True)
 
+    def _fill_joint(self):
+        """Trains instances that differ only in seed jointly, one group of seeds per cycle"""
+        from foundation.fnn.model import Model
+
+        # instances grouped by data, network, and parameters other than seed
+        groups = dict()
+
+        for key in self.key:
+
+            # instance parameters
+            instance = (fnn.Instance.Individual & key).fetch1()
+            instance.pop("instance_id")
+
+            group = [key["data_id"], key["network_id"]]
+            group += sorted((k, v) for k, v in instance.items() if k != "seed")
+            groups.setdefault(tuple(group), []).append(instance)
+
+        for (data_id, network_id, *_), instances in groups.items():
+
+            # train each cycle sequentially
+            for cycle in range(instances[0]["cycle"] + 1):
+
+                # break if previous model cycle has not been trained
+                if cycle and len(Model & models) < len(models):
+                    break
+
+                # cycle instances
+                models = []
+                for instance in instances:
+                    _instance = dict(instance, cycle=cycle)
+                    _instance_id = (fnn.Instance.Individual & _instance).fetch1("instance_id")
+                    models.append(dict(data_id=data_id, network_id=network_id, instance_id=_instance_id))
+
+                # train models jointly
+                Model.fill_joint(data_id, network_id, [_["instance_id"] for _ in models])
+
 
 @keys
 class VisualScanFoundationModel:
@@ -43,6 +43,63 @@ class Model:
             # insert
             self.insert1(dict(key, data_id=data_id, network_id=network_id))
 
+    @classmethod
+    def fill_joint(cls, data_id, network_id, instance_ids, device=None):
+        """Trains the models of multiple individual instances jointly, sharing one dataset and set of processes
+
+        Parameters
+        ----------
+        data_id : str
+            key (foundation.fnn.data.Data)
+        network_id : str
+            key (foundation.fnn.network.Network)
+        instance_ids : Sequence[str]
+            keys (foundation.fnn.instance.Instance.Individual)
+        device : "cuda" | "cpu" | None
+            training device -- FOUNDATION_DEVICE if None, and cuda if available if that is not set either
+        """
+        from traceback import format_exc
+        from foundation.fnn.compute.instance import Individual
+
+        # pending instances
+        key = {"data_id": data_id, "network_id": network_id}
+        instances = Instance.Individual & [{"instance_id": _} for _ in instance_ids]
+        instances = instances - (cls & key).proj()
+
+        # reserve jobs, skipping models that are reserved by other workers
+        table = cls()
+        jobs = table.connection.schemas[table.database].jobs
+        keys = [dict(key, instance_id=_) for _ in instances.fetch("instance_id", order_by="instance_id")]
+        keys = [_ for _ in keys if jobs.reserve(table.table_name, _)]
+
+        if not keys:
+            return
+
+        try:
+            # instantiate jointly
+            instances = Individual & [{"instance_id": _["instance_id"]} for _ in keys]
+            models = instances.instantiate_joint(data_id=data_id, network_id=network_id, device=device)
+
+            for data_id, network_id, instance_id in models:
+
+                # insert
+                cls.insert1(
+                    {"data_id": data_id, "network_id": network_id, "instance_id": instance_id},
+                    skip_duplicates=True,
+                    allow_direct_insert=True,
+                )
+
+        except Exception as error:
+            # record errors
+            message = f"{error.__class__.__qualname__}: {error}"
+            for _ in keys:
+                jobs.error(table.table_name, _, error_message=message, error_stack=format_exc())
+            raise
+
+        # release reservations
+        for _ in keys:
+            jobs.complete(table.table_name, _)
+
     @rowmethod
     def parameters(self, device="cpu"):
         """
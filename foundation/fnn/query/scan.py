@@ -57,15 +57,14 @@ class VisualScanCorrelation:
             "correlation_id": utility.Correlation.CCSignal.fetch1("correlation_id"),
         }
 
-        traces = recording.ScanUnitOrder & ukey
+        traces = recording.ScanUnitOrder * recording.ScanUnits & ukey
 
-        measures = (recording.VisualMeasure * traces & mkey & self.item).proj(
-            cc_max="measure", unit="trace_order"
-        )
+        # trace set measures, and per-trace measures of traces without a trace set measure
+        traces_measures = recording.VisualTracesMeasure * traces & mkey & self.item
+        trace_measures = recording.VisualMeasure * traces & mkey & self.item
+        trace_measures = trace_measures - recording.VisualTracesMeasure.proj()
 
         correlations = (fnn.VisualRecordingCorrelation & ckey & self.item).proj(cc_abs="correlation")
-        units = correlations * measures * recording.Trace.ScanUnit
-        assert len(units) == data.units
 
         cols = [
             "animal_id",
@@ -78,7 +77,17 @@ class VisualScanCorrelation:
             "cc_abs",
             "cc_max",
         ]
-        df = pd.DataFrame(units.fetch(*cols, as_dict=True))[cols]
+
+        # cc_max of each unit from either measure table
+        dfs = []
+        for measures in [traces_measures, trace_measures]:
+            measures = measures.proj(cc_max="measure", unit="trace_order")
+            units = correlations * measures * recording.Trace.ScanUnit
+            dfs.append(pd.DataFrame(units.fetch(*cols, as_dict=True), columns=cols))
+
+        df = pd.concat(dfs, ignore_index=True)
+        assert len(df) == data.units
+
         df["cc_norm"] = df.cc_abs / df.cc_max
 
         return df
@@ -236,3 +236,139 @@ class ResampledTraces:
 
             # resampled traces
             yield np.stack([r(start, end) for r in resamplers], axis=1)
+
+    @rowmethod
+    def max_error(self, precision, trial_ids=None):
+        """
+        Parameters
+        ----------
+        precision : str
+            storage precision -- "float16" | "bfloat16"
+        trial_ids : Sequence[str] | None
+            sequence of keys (foundation.recording.trial.Trial) -- all trials if None
+
+        Returns
+        -------
+        1D array | None
+            [traces] -- maximum absolute error of storing the resampled traces at the given precision,
+                        ordered by traceset index -- None if there are no trials
+        """
+        from foundation.utils.precision import max_error
+        from foundation.recording.compute.trace import Traces
+
+        if trial_ids is None:
+            trial_ids = (Traces & self.item).trials.fetch("trial_id", order_by="trial_id").tolist()
+        else:
+            assert not set(trial_ids) - (Traces & self.item).trial_ids, "Invalid trial_ids"
+
+        # trace resamplers
+        resamplers = self.resamplers
+
+        # maximum error across trials
+        error = None
+
+        for trial_id in tqdm(trial_ids, desc="Trials"):
+            # trial start and end times
+            start, end = (recording.TrialBounds & {"trial_id": trial_id}).fetch1("start", "end")
+
+            # resampled traces
+            traces = np.stack([r(start, end) for r in resamplers], axis=1)
+
+            # trial error, sized by the first trial
+            _error = max_error(traces, precision, axis=0)
+            error = _error if error is None else np.fmax(error, _error)
+
+        return error
+
+
+@keys
+class ResampledTracesSweep:
+    """Resampled Trace Set -- Offset and Rate Sweep"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet,
+            utility.Resample,
+        ]
+
+    @rowmethod
+    def resamplers(self, rate_ids):
+        """
+        Parameters
+        ----------
+        rate_ids : Sequence[str]
+            sequence of keys (foundation.utility.resample.Rate)
+
+        Returns
+        -------
+        dict[str, tuple[foundation.utils.resample.Resample]]
+            rate_id -> tuple of trace resamplers, ordered by traceset_index
+        """
+        from foundation.utility.resample import Rate, Resample
+        from foundation.recording.trace import Trace, TraceSet
+
+        # resampling periods, method
+        periods = {rate_id: (Rate & {"rate_id": rate_id}).link.period for rate_id in rate_ids}
+        resample = (Resample & self.item).link.resample
+
+        # trace set
+        trace_ids = (TraceSet & self.item).members.fetch("trace_id", order_by="traceset_index")
+        trace_ids = tqdm(trace_ids, desc="Traces")
+
+        # trace resamplers
+        resamplers = {rate_id: [] for rate_id in periods}
+
+        for trace_id in trace_ids:
+
+            # trace loaded once for all rates
+            trace = (Trace & {"trace_id": trace_id}).link.compute
+            times, values = trace.times, trace.values
+
+            for rate_id, period in periods.items():
+                resampler = resample(times=times, values=values, target_period=period, target_offset=0)
+                resamplers[rate_id].append(resampler)
+
+        return {rate_id: tuple(r) for rate_id, r in resamplers.items()}
+
+    @rowmethod
+    def trials(self, trial_ids, pairs):
+        """
+        Parameters
+        ----------
+        trial_ids : Sequence[str]
+            sequence of keys (foundation.recording.trial.Trial)
+        pairs : Sequence[tuple[str, str]]
+            sequence of (offset_id, rate_id) -- keys (foundation.utility.resample.Offset, Rate)
+
+        Yields
+        ------
+        dict[tuple[str, str], 2D array]
+            (offset_id, rate_id) -> [samples, traces] -- resampled traces (ordered by traceset index)
+        """
+        from foundation.utility.resample import Offset
+        from foundation.recording.compute.trace import Traces
+
+        # verify trial_ids
+        assert not set(trial_ids) - (Traces & self.item).trial_ids, "Invalid trial_ids"
+
+        # sampling offsets
+        pairs = list(dict.fromkeys(pairs))
+        offsets = {o: (Offset & {"offset_id": o}).link.offset for o in dict.fromkeys(o for o, _ in pairs)}
+
+        # trace resamplers, filtered once per rate
+        resamplers = self.resamplers(list(dict.fromkeys(r for _, r in pairs)))
+
+        for trial_id in trial_ids:
+            # trial start and end times
+            start, end = (recording.TrialBounds & {"trial_id": trial_id}).fetch1("start", "end")
+
+            # resampled traces for each offset and rate
+            traces = {}
+            for offset_id, rate_id in pairs:
+                offset = offsets[offset_id]
+                traces[offset_id, rate_id] = np.stack(
+                    [r.sample(start, end, r.target_period, offset) for r in resamplers[rate_id]], axis=1
+                )
+
+            yield traces
@@ -1,5 +1,6 @@
 import numpy as np
-from djutils import keys, rowproperty
+from djutils import keys, rowproperty, rowmethod
+from foundation.utils import tqdm
 from foundation.virtual import utility, recording
 
 
@@ -42,3 +43,53 @@ class TraceSummary:
 
         # summary statistic
         return (Summary & self.item).link.summary(trials)
+
+
+@keys
+class TraceSetSummary:
+    """Trace Set Summary"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialSet & "members > 0",
+            utility.Resample,
+            utility.Offset,
+            utility.Rate,
+        ]
+
+    @rowmethod
+    def summaries(self, summary_ids):
+        """
+        Parameters
+        ----------
+        summary_ids : Sequence[str]
+            sequence of keys (foundation.utility.stat.Summary)
+
+        Returns
+        -------
+        dict[str, 1D array]
+            summary_id -> [traces] -- trace summary statistics, ordered by traceset_index
+        """
+        from foundation.utility.stat import Summary
+        from foundation.recording.trial import TrialSet
+        from foundation.recording.compute.resample import ResampledTraces
+
+        # streaming summary statistics
+        accumulators = {_: (Summary & {"summary_id": _}).link.accumulator() for _ in summary_ids}
+
+        # recording trials
+        trial_ids = (TrialSet & self.item).members.fetch("trial_id", order_by="trialset_index")
+
+        # resampled traces
+        trials = (ResampledTraces & self.item).trials(trial_ids)
+        trials = tqdm(trials, total=len(trial_ids), desc="Trials")
+
+        # single pass over trials
+        for traces in trials:
+
+            for accumulator in accumulators.values():
+                accumulator.update(traces)
+
+        return {k: v.result for k, v in accumulators.items()}
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from djutils import keys, merge, rowmethod, rowproperty, cache_rowproperty, U
+from djutils import keys, merge, unique, rowmethod, rowproperty, cache_rowproperty, U
 from foundation.utils import tqdm, logger
 from foundation.virtual import utility, stimulus, recording
 
@@ -111,6 +111,192 @@ class VisualMeasure:
         return (Measure & self.item).link.measure(responses)
 
 
+@keys
+class VisualTracesMeasure:
+    """Visual Measure -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Resample,
+            utility.Offset,
+            utility.Rate,
+            utility.Measure,
+            utility.Burnin,
+        ]
+
+    @rowmethod
+    def measures(self):
+        """
+        Returns
+        -------
+        1D array | None
+            [traces] -- visual response measures, ordered by traceset_index
+        """
+        from foundation.recording.trace import TraceSet
+        from foundation.utility.response import Measure
+        from foundation.utils.precision import decode
+        from foundation.utils.response import Trials, concatenate
+
+        # trial set
+        trialset = merge((TraceSet & self.item).members, recording.TraceTrials)
+        trialset = {"trialset_id": unique(trialset, "trialset_id")}
+
+        # trial df
+        df = (VisualTrialSet & trialset & self.item).df
+
+        # no trials at all
+        if not len(df):
+            logger.warning(f"No trials found")
+            return
+
+        # stored resampled traces
+        trials = recording.ResampledTraces & self.item & df[["trial_id"]].to_dict("records")
+        trial_ids, traces = trials.fetch("trial_id", "traces")
+        traces = dict(zip(trial_ids, map(decode, traces)))
+
+        # verify trials
+        assert set(df.trial_id) == set(traces), "ResampledTraces not populated"
+
+        # trial responses
+        responses = []
+
+        for video_id, vdf in df.groupby("video_id"):
+
+            # trial ids
+            trial_ids = list(vdf.trial_id)
+
+            # trial responses -- [samples, traces]
+            trials = Trials([traces.pop(_) for _ in trial_ids], index=trial_ids, tolerance=1)
+
+            # append
+            responses.append(trials)
+
+        # concatenated responses -- [trials, samples, traces]
+        responses = concatenate(*responses, burnin=self.item["burnin"])
+
+        # response measures
+        return (Measure & self.item).link.measure(responses)
+
+
+@keys
+class VisualTracesResponse:
+    """Visual Response -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            utility.Offset,
+            utility.Impulse,
+        ]
+
+    @rowproperty
+    def trialset_id(self):
+        """
+        Returns
+        -------
+        str
+            key (foundation.recording.trial.TrialSet)
+        """
+        return (VisualTracesSweep & self.item).trialset_id
+
+    @rowmethod
+    def responses(self, starts, ends, chunksize=128):
+        """
+        Parameters
+        ----------
+        starts : 1D array
+            [events] -- start times of response windows (seconds)
+        ends : 1D array
+            [events] -- end times of response windows (seconds)
+        chunksize : int
+            number of traces loaded at once
+
+        Returns
+        -------
+        2D array
+            [events, traces] -- responses, ordered by traceset_index
+        """
+        offset_ids = [self.item["offset_id"]]
+
+        return (VisualTracesSweep & self.item).responses(starts, ends, offset_ids, chunksize)[0]
+
+
+@keys
+class VisualTracesSweep:
+    """Visual Response -- Trace Set, Offset Sweep"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            utility.Impulse,
+        ]
+
+    @rowproperty
+    def trialset_id(self):
+        """
+        Returns
+        -------
+        str
+            key (foundation.recording.trial.TrialSet)
+        """
+        from foundation.recording.trace import TraceSet
+
+        return unique(merge((TraceSet & self.item).members, recording.TraceTrials), "trialset_id")
+
+    @rowmethod
+    def responses(self, starts, ends, offset_ids, chunksize=128):
+        """
+        Parameters
+        ----------
+        starts : 1D array
+            [events] -- start times of response windows (seconds)
+        ends : 1D array
+            [events] -- end times of response windows (seconds)
+        offset_ids : Sequence[str]
+            [offsets] -- keys (foundation.utility.resample.Offset)
+        chunksize : int
+            number of traces loaded at once
+
+        Returns
+        -------
+        3D array
+            [offsets, events, traces] -- responses, ordered by traceset_index
+        """
+        from foundation.recording.trace import Trace, TraceSet
+        from foundation.utility.resample import Offset
+        from foundation.utility.impulse import Impulse
+
+        # trace ids
+        trace_ids = (TraceSet & self.item).members.fetch("trace_id", order_by="traceset_index")
+
+        # offsets
+        offsets = [(Offset & {"offset_id": _}).link.offset for _ in offset_ids]
+
+        # impulse
+        impulse = (Impulse & self.item).link
+
+        # responses
+        responses = []
+
+        for i in tqdm(range(0, len(trace_ids), chunksize), desc="Traces"):
+
+            # trace times and values -- [time, traces]
+            traces = [(Trace & {"trace_id": _}).link.compute for _ in trace_ids[i : i + chunksize]]
+            times = np.stack([_.times for _ in traces], axis=1)
+            values = np.stack([_.values for _ in traces], axis=1)
+
+            # response windows, swept over offsets
+            responses.append(impulse.impulse(times, values, 0).sweep(starts, ends, offsets))
+
+        return np.concatenate(responses, axis=2)
+
+
 @keys
 class VisualDirectionSet:
     """Visual Direction Set"""
@@ -164,17 +350,15 @@ class VisualDirectionTuning:
             utility.Precision,
         ]
 
-    @rowmethod
-    def tuning(self):
+    @rowproperty
+    def events(self):
         """
         Returns
         -------
         1D array
-            directions (degrees)
+            [events] -- discretized directions (degrees)
         1D array
-            response (STA) to directions
-        1D array
-            density of directions
+            [events] -- responses to directions
         """
         from foundation.recording.trace import Trace
         from foundation.utility.resample import Offset
@@ -192,31 +376,165 @@ class VisualDirectionTuning:
         impulse = (Impulse & self.item).link.impulse(times, values, offset)
 
         # precision
-        pstr = (Precision & self.item).link.string
+        rnd = (Precision & self.item).link.round
 
         # trialset
         trialset = (recording.TraceTrials & self.item).fetch1()
 
         # trial and video dataframe
-        df = (VisualDirectionSet & trialset & self.item).df.copy()
+        df = (VisualDirectionSet & trialset & self.item).df
 
-        # direction response
-        df["response"] = df.apply(lambda x: impulse(x.start + x.onset, x.start + x.offset), axis=1)
+        # direction responses -- [events]
+        responses = impulse.windows(df.start + df.onset, df.start + df.offset)
 
-        # direction discretization
-        df["direction"] = df.apply(lambda x: pstr(x.direction), axis=1)
+        return rnd(df.direction), responses
 
-        # drop NA response
-        df = df[df.response.notna()]
+    @rowmethod
+    def tuning(self):
+        """
+        Returns
+        -------
+        1D array
+            directions (degrees)
+        1D array
+            response (STA) to directions
+        1D array
+            density of directions
+        """
+        from foundation.utils.tuning import direction_sta
+
+        # direction events
+        directions, responses = self.events
 
         # compute response and density
-        df = df.groupby("direction")
-        df = df.agg(dict(response=["mean", "count"]))
-        df.index = df.index.astype(float)
-        df = df.reset_index()
-        df = df.sort_values("direction")
+        direction, response, density = direction_sta(directions, responses[:, None])
+
+        # drop directions without responses
+        keep = density[0] > 0
+
+        return direction[keep], response[0, keep], density[0, keep]
+
+
+@keys
+class VisualTracesDirectionTuning:
+    """Visual Direction Tuning -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Offset,
+            utility.Impulse,
+            utility.Precision,
+        ]
+
+    @rowproperty
+    def events(self):
+        """
+        Returns
+        -------
+        1D array
+            [events] -- discretized directions (degrees)
+        2D array
+            [events, traces] -- responses to directions, ordered by traceset_index
+        """
+        from foundation.utility.numeric import Precision
+
+        # precision
+        rnd = (Precision & self.item).link.round
+
+        # trialset
+        trialset = {"trialset_id": (VisualTracesResponse & self.item).trialset_id}
+
+        # trial and video dataframe
+        df = (VisualDirectionSet & trialset & self.item).df
+
+        # direction responses -- [events, traces]
+        responses = (VisualTracesResponse & self.item).responses(df.start + df.onset, df.start + df.offset)
+
+        return rnd(df.direction), responses
+
+    @rowmethod
+    def tuning(self):
+        """
+        Yields
+        ------
+        1D array
+            directions (degrees)
+        1D array
+            response (STA) to directions
+        1D array
+            density of directions
+        """
+        from foundation.utils.tuning import direction_sta
 
-        return df["direction"].values, df["response"]["mean"].values, df["response"]["count"].values
+        # direction events -- [events], [events, traces]
+        directions, responses = self.events
+
+        # compute response and density -- [traces, directions]
+        direction, response, density = direction_sta(directions, responses)
+
+        # per-trace tuning, dropping directions without responses
+        for r, d in zip(response, density):
+            keep = d > 0
+            yield direction[keep], r[keep], d[keep]
+
+
+@keys
+class VisualTracesDirectionSweep:
+    """Visual Direction Tuning -- Trace Set, Offset Sweep"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Impulse,
+            utility.Precision,
+        ]
+
+    @rowmethod
+    def tuning(self, offset_ids):
+        """
+        Parameters
+        ----------
+        offset_ids : Sequence[str]
+            [offsets] -- keys (foundation.utility.resample.Offset)
+
+        Returns
+        -------
+        1D array
+            [directions] -- directions (degrees)
+        3D array
+            [offsets, traces, directions] -- response (STA) to directions
+        3D array
+            [offsets, traces, directions] -- density of directions
+        """
+        from foundation.utility.numeric import Precision
+        from foundation.utils.tuning import direction_sta
+
+        # precision
+        rnd = (Precision & self.item).link.round
+
+        # trialset
+        trialset = {"trialset_id": (VisualTracesSweep & self.item).trialset_id}
+
+        # trial and video dataframe
+        df = (VisualDirectionSet & trialset & self.item).df
+
+        # direction responses -- [offsets, events, traces]
+        sweep = VisualTracesSweep & self.item
+        responses = sweep.responses(df.start + df.onset, df.start + df.offset, offset_ids)
+        offsets, events, traces = responses.shape
+
+        # compute response and density -- [offsets * traces, directions]
+        responses = responses.transpose(1, 0, 2).reshape(events, offsets * traces)
+        direction, response, density = direction_sta(rnd(df.direction), responses)
+
+        return direction, response.reshape(offsets, traces, -1), density.reshape(offsets, traces, -1)
 
 
 @keys
@@ -288,6 +606,7 @@ class VisualSpatialTuning:
         from foundation.recording.trace import Trace
         from foundation.utility.resample import Offset
         from foundation.utility.impulse import Impulse
+        from foundation.utils.tuning import spatial_sta
 
         # trace times and values
         trace = (Trace & self.item).link.compute
@@ -315,10 +634,114 @@ class VisualSpatialTuning:
         for spatial_type, sdf in df.groupby("spatial_type"):
 
             # compute density and response
-            grids = np.stack(sdf.spatial_grid, axis=-1)
-            responses = sdf.response.values
-            masks = np.isfinite(responses)
-            density = np.sum(grids * masks, axis=-1)
-            sta = np.nansum(grids * responses, axis=-1) / density
+            grids = np.stack(sdf.spatial_grid, axis=0)
+            responses = sdf.response.values.astype(float)[:, None]
+            sta, density = spatial_sta(grids, responses)
+
+            yield spatial_type, sta[0], density[0]
+
+
+@keys
+class VisualTracesSpatialTuning:
+    """Visual Spatial Tuning -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Offset,
+            utility.Impulse,
+            utility.Resolution,
+        ]
+
+    @rowmethod
+    def tuning(self):
+        """
+        Yields
+        ------
+        str
+            spatial type
+        3D array
+            response (STA) to spatial locations -- [traces, height, width]
+        3D array
+            density of spatial locations -- [traces, height, width]
+        """
+        from foundation.utils.tuning import spatial_sta
+
+        # trialset
+        trialset = {"trialset_id": (VisualTracesResponse & self.item).trialset_id}
+
+        # trial and video dataframe
+        df = (VisualSpatialSet & trialset & self.item).df
+
+        # spatial responses -- [events, traces]
+        responses = (VisualTracesResponse & self.item).responses(df.start + df.onset, df.start + df.offset)
+
+        # iterate spatial types
+        for spatial_type, sdf in df.groupby("spatial_type"):
+
+            # compute density and STA -- [traces, height, width]
+            grids = np.stack(sdf.spatial_grid, axis=0)
+            sta, density = spatial_sta(grids, responses[sdf.index])
+
+            yield spatial_type, sta, density
+
+
+@keys
+class VisualTracesSpatialSweep:
+    """Visual Spatial Tuning -- Trace Set, Offset Sweep"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Impulse,
+            utility.Resolution,
+        ]
+
+    @rowmethod
+    def tuning(self, offset_ids):
+        """
+        Parameters
+        ----------
+        offset_ids : Sequence[str]
+            [offsets] -- keys (foundation.utility.resample.Offset)
+
+        Yields
+        ------
+        str
+            spatial type
+        4D array
+            response (STA) to spatial locations -- [offsets, traces, height, width]
+        4D array
+            density of spatial locations -- [offsets, traces, height, width]
+        """
+        from foundation.utils.tuning import spatial_sta
+
+        # trialset
+        trialset = {"trialset_id": (VisualTracesSweep & self.item).trialset_id}
+
+        # trial and video dataframe
+        df = (VisualSpatialSet & trialset & self.item).df
+
+        # spatial responses -- [offsets, events, traces]
+        sweep = VisualTracesSweep & self.item
+        responses = sweep.responses(df.start + df.onset, df.start + df.offset, offset_ids)
+        offsets, events, traces = responses.shape
+
+        # [events, offsets * traces]
+        responses = responses.transpose(1, 0, 2).reshape(events, offsets * traces)
+
+        # iterate spatial types
+        for spatial_type, sdf in df.groupby("spatial_type"):
+
+            # compute density and STA -- [offsets * traces, height, width]
+            grids = np.stack(sdf.spatial_grid, axis=0)
+            sta, density = spatial_sta(grids, responses[sdf.index])
 
-            yield spatial_type, sta.astype(np.float32), density.astype(np.float32)
+            shape = offsets, traces, *sta.shape[1:]
+            yield spatial_type, sta.reshape(shape), density.reshape(shape)
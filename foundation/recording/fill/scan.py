@@ -1,4 +1,4 @@
-from djutils import keys, merge, cache_rowproperty
+from djutils import keys, merge
 from foundation.virtual.bridge import pipe_fuse, pipe_shared
 from foundation.virtual import scan, recording, stimulus, utility
 
@@ -149,16 +149,28 @@ class VisualScanMeasure:
 
     def fill(self):
         from foundation.recording.trace import TraceSet
-        from foundation.recording.visual import VisualMeasure
+        from foundation.recording.resample import ResampledTraces
+        from foundation.recording.visual import VisualTracesMeasure
+
+        # scan trace sets and resampling methods
+        sweeps = (recording.ScanUnits * utility.Resample & self.key).proj("traceset_id")
+
+        for key in sweeps.fetch(as_dict=True):
+
+            # offsets and rates of the measures
+            pairs = (self.key & key).fetch("offset_id", "rate_id")
+            pairs = sorted(set(zip(*pairs)))
+
+            # resampled traces, swept over offsets and rates in one pass
+            ResampledTraces.fill(key, pairs)
 
         for key in self.key:
 
             traces = recording.ScanUnits & key
-            traces = (TraceSet & traces).members
+            traces = (TraceSet & traces).proj()
 
-            with cache_rowproperty():
-
-                VisualMeasure.populate(key, traces, reserve_jobs=True, display_progress=True)
+            # visual measures
+            VisualTracesMeasure.populate(key, traces, reserve_jobs=True, display_progress=True)
 
 
 @keys
@@ -178,16 +190,15 @@ class VisualScanDirectionTuning:
 
     def fill(self):
         from foundation.recording.trace import TraceSet
-        from foundation.recording.visual import VisualDirectionTuning
+        from foundation.recording.visual import VisualTracesDirectionTuning
 
         for key in self.key:
 
             traces = recording.ScanUnits & key
-            traces = (TraceSet & traces).members
-
-            with cache_rowproperty():
+            traces = (TraceSet & traces).proj()
 
-                VisualDirectionTuning.populate(key, traces, reserve_jobs=True, display_progress=True)
+            # trace set direction tuning
+            VisualTracesDirectionTuning.populate(key, traces, reserve_jobs=True, display_progress=True)
 
 
 @keys
@@ -207,13 +218,12 @@ class VisualScanSpatialTuning:
 
     def fill(self):
         from foundation.recording.trace import TraceSet
-        from foundation.recording.visual import VisualSpatialTuning
+        from foundation.recording.visual import VisualTracesSpatialTuning
 
         for key in self.key:
 
             traces = recording.ScanUnits & key
-            traces = (TraceSet & traces).members
-
-            with cache_rowproperty():
+            traces = (TraceSet & traces).proj()
 
-                VisualSpatialTuning.populate(key, traces, reserve_jobs=True, display_progress=True)
+            # trace set spatial tuning
+            VisualTracesSpatialTuning.populate(key, traces, reserve_jobs=True, display_progress=True)
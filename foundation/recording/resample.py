@@ -1,7 +1,7 @@
 import numpy as np
 from foundation.virtual import utility
 from foundation.recording.trial import Trial
-from foundation.recording.trace import TraceSet
+from foundation.recording.trace import Trace, TraceSet
 from foundation.schemas import recording as schema
 
 
@@ -55,18 +55,159 @@ class ResampledTraces:
     -> utility.Offset
     -> utility.Rate
     ---
-    traces      : blob@external     # [samples, traces]
+    traces      : blob@external     # [samples, traces] -- float64 | float16 | uint16 (bfloat16)
     finite      : bool              # all values finite
     """
 
+    @property
+    def key_source(self):
+        keys = (TraceSet & "members > 0").proj() * utility.Resample.proj() * utility.Offset.proj()
+        return keys * utility.Rate.proj()
+
+    @property
+    def target(self):
+        return ResampledTracesDone
+
     def make(self, key):
         from foundation.recording.compute.resample import ResampledTraces
+        from foundation.recording.compute.trace import Traces
+        from foundation.utility.resample import Resample
+        from foundation.utils.precision import encode, decode
+        from foundation.utils import tqdm
 
-        # resampled traces
-        traces = (ResampledTraces & key).trial(trial_id=key["trial_id"])
+        # storage precision
+        precision = (Resample & key).link.precision
 
-        # trace values finite
-        finite = np.isfinite(traces).all()
+        # pending trials
+        trials = (Traces & key).trials - (self & key)
+        trial_ids = trials.fetch("trial_id", order_by="trial_id").tolist()
 
-        # insert
-        self.insert1(dict(key, traces=traces, finite=bool(finite)))
+        # resampled traces
+        traces = (ResampledTraces & key).trials(trial_ids=trial_ids)
+        traces = tqdm(traces, total=len(trial_ids), desc="Trials")
+
+        # rows, inserted in ~1 GB chunks to bound client memory -- populate commits all chunks and the done
+        # marker in one transaction, so an interrupted make leaves nothing behind
+        rows, nbytes = [], 0
+
+        for trial_id, _traces in zip(trial_ids, traces):
+
+            # stored trace values, finite after encoding
+            _traces = encode(_traces, precision)
+            finite = np.isfinite(decode(_traces)).all()
+
+            # collect row
+            rows.append(dict(key, trial_id=trial_id, traces=_traces, finite=bool(finite)))
+            nbytes += _traces.nbytes
+
+            # insert chunk
+            if nbytes >= 2**30:
+                self.insert(rows)
+                rows, nbytes = [], 0
+
+        # insert remaining
+        if rows:
+            self.insert(rows)
+
+        # register done
+        ResampledTracesDone.insert1(key)
+
+    @classmethod
+    def fill(cls, key, pairs):
+        """Inserts resampled traces for multiple offsets and rates in one pass over the traces
+
+        Parameters
+        ----------
+        key : dict
+            key (foundation.recording.trace.TraceSet, foundation.utility.resample.Resample)
+        pairs : Sequence[tuple[str, str]]
+            sequence of (offset_id, rate_id) -- keys (foundation.utility.resample.Offset, Rate)
+        """
+        from traceback import format_exc
+        from foundation.recording.compute.resample import ResampledTracesSweep
+        from foundation.recording.compute.trace import Traces
+        from foundation.utility.resample import Resample
+        from foundation.utils.precision import encode, decode
+        from foundation.utils import tqdm
+
+        key = (TraceSet * utility.Resample & key).fetch1("KEY")
+
+        # pending offsets and rates
+        done = set(zip(*(ResampledTracesDone & key).fetch("offset_id", "rate_id")))
+        keys = [dict(key, offset_id=o, rate_id=r) for o, r in dict.fromkeys(pairs) if (o, r) not in done]
+
+        # reserve jobs, the same keys that populate reserves, skipping those reserved by other workers
+        table = cls()
+        jobs = table.connection.schemas[table.database].jobs
+        keys = [_ for _ in keys if jobs.reserve(table.table_name, _)]
+
+        if not keys:
+            return
+
+        try:
+            # storage precision
+            precision = (Resample & key).link.precision
+            pairs = [(_["offset_id"], _["rate_id"]) for _ in keys]
+
+            # existing rows, left by an interrupted fill
+            rows = (cls & key & keys).fetch("trial_id", "offset_id", "rate_id")
+            rows = set(zip(*rows))
+
+            # pending trials
+            trial_ids = (Traces & key).trials.fetch("trial_id", order_by="trial_id").tolist()
+            trial_ids = [t for t in trial_ids if any((t, *pair) not in rows for pair in pairs)]
+
+            # resampled traces
+            traces = (ResampledTracesSweep & key).trials(trial_ids=trial_ids, pairs=pairs)
+            traces = tqdm(traces, total=len(trial_ids), desc="Trials")
+
+            # rows, inserted in ~1 GB chunks -- keys are marked done only after all of their trials are
+            # inserted, so an interrupted fill is resumed by the next fill or populate
+            chunk, nbytes = [], 0
+
+            for trial_id, _traces in zip(trial_ids, traces):
+
+                for (offset_id, rate_id), t in _traces.items():
+
+                    if (trial_id, offset_id, rate_id) in rows:
+                        continue
+
+                    # collect row, finite after encoding
+                    t = encode(t, precision)
+                    finite = np.isfinite(decode(t)).all()
+                    row = dict(key, trial_id=trial_id, offset_id=offset_id, rate_id=rate_id)
+                    chunk.append(dict(row, traces=t, finite=bool(finite)))
+                    nbytes += t.nbytes
+
+                # insert chunk
+                if nbytes >= 2**30:
+                    cls.insert(chunk, skip_duplicates=True, allow_direct_insert=True)
+                    chunk, nbytes = [], 0
+
+            # insert remaining
+            if chunk:
+                cls.insert(chunk, skip_duplicates=True, allow_direct_insert=True)
+
+            # register done
+            ResampledTracesDone.insert(keys, skip_duplicates=True)
+
+        except Exception as error:
+            # record errors
+            message = f"{error.__class__.__qualname__}: {error}"
+            for _ in keys:
+                jobs.error(table.table_name, _, error_message=message, error_stack=format_exc())
+            raise
+
+        # release reservations
+        for _ in keys:
+            jobs.complete(table.table_name, _)
+
+
+@schema.lookup
+class ResampledTracesDone:
+    definition = """
+    -> TraceSet
+    -> utility.Resample
+    -> utility.Offset
+    -> utility.Rate
+    """
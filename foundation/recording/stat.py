@@ -1,5 +1,5 @@
 from foundation.virtual import utility
-from foundation.recording.trace import Trace
+from foundation.recording.trace import Trace, TraceSet
 from foundation.recording.trial import TrialSet
 from foundation.schemas import recording as schema
 
@@ -28,3 +28,43 @@ class TraceSummary:
 
         # insert
         self.insert1(key)
+
+    @classmethod
+    def fill(cls, key, summary_ids):
+        """
+        Parameters
+        ----------
+        key : dict[str, str]
+            key (foundation.recording.trace.TraceSet, foundation.recording.trial.TrialSet,
+            foundation.utility.resample.Resample, foundation.utility.resample.Offset,
+            foundation.utility.resample.Rate)
+        summary_ids : Sequence[str]
+            sequence of keys (foundation.utility.stat.Summary)
+        """
+        from foundation.recording.compute.stat import TraceSetSummary
+
+        # traces
+        trace_ids = (TraceSet & key).members.fetch("trace_id", order_by="traceset_index")
+
+        # computed summaries
+        done = cls & key & (TraceSet & key).members.proj() & [{"summary_id": _} for _ in summary_ids]
+        done = set(zip(*done.fetch("trace_id", "summary_id")))
+
+        # pending summaries
+        summary_ids = [s for s in summary_ids if any((t, s) not in done for t in trace_ids)]
+        if not summary_ids:
+            return
+
+        # trace set summaries
+        summaries = (TraceSetSummary & key).summaries(summary_ids)
+
+        # summary keys
+        keys = []
+        for summary_id, summary in summaries.items():
+            for trace_id, value in zip(trace_ids, summary):
+
+                if (trace_id, summary_id) not in done:
+                    keys.append(dict(key, trace_id=trace_id, summary_id=summary_id, summary=value))
+
+        # insert
+        cls.insert(keys, skip_duplicates=True, ignore_extra_fields=True, allow_direct_insert=True)
@@ -1,6 +1,6 @@
 from foundation.virtual import utility, stimulus
 from foundation.recording.trial import Trial, TrialFilterSet
-from foundation.recording.trace import Trace
+from foundation.recording.trace import Trace, TraceSet
 from foundation.schemas import recording as schema
 
 
@@ -35,6 +35,48 @@ class VisualMeasure:
         self.insert1(key)
 
 
+@schema.computed
+class VisualTracesMeasure:
+    definition = """
+    -> TraceSet
+    -> TrialFilterSet
+    -> stimulus.VideoSet
+    -> utility.Resample
+    -> utility.Offset
+    -> utility.Rate
+    -> utility.Measure
+    -> utility.Burnin
+    -> Trace
+    ---
+    measure = NULL      : float     # visual response measure
+    """
+
+    @property
+    def key_source(self):
+        from foundation.recording.compute.visual import VisualTracesMeasure
+
+        return VisualTracesMeasure.key_source
+
+    def make(self, key):
+        from foundation.recording.compute.visual import VisualTracesMeasure
+
+        # trace ids
+        trace_ids = (TraceSet & key).members.fetch("trace_id", order_by="traceset_index")
+
+        # visual measures
+        measures = (VisualTracesMeasure & key).measures()
+
+        if measures is None:
+            measures = [None] * len(trace_ids)
+
+        # verify traces
+        assert len(measures) == len(trace_ids)
+
+        # insert
+        keys = [dict(key, trace_id=t, measure=m) for t, m in zip(trace_ids, measures)]
+        self.insert(keys)
+
+
 @schema.computed
 class VisualDirectionTuning:
     definition = """
@@ -66,6 +108,47 @@ class VisualDirectionTuning:
         self.insert1(key)
 
 
+@schema.computed
+class VisualTracesDirectionTuning:
+    definition = """
+    -> TraceSet
+    -> TrialFilterSet
+    -> stimulus.VideoSet
+    -> utility.Offset
+    -> utility.Impulse
+    -> utility.Precision
+    -> Trace
+    ---
+    direction               : longblob         # presented directions (degrees, sorted)
+    response                : longblob         # response (STA) to directions
+    density                 : longblob         # density of directions
+    """
+
+    @property
+    def key_source(self):
+        from foundation.recording.compute.visual import VisualTracesDirectionTuning
+
+        return VisualTracesDirectionTuning.key_source
+
+    def make(self, key):
+        from foundation.recording.compute.visual import VisualTracesDirectionTuning
+
+        # trace ids
+        trace_ids = (TraceSet & key).members.fetch("trace_id", order_by="traceset_index")
+
+        # visual direction tuning
+        tuning = list((VisualTracesDirectionTuning & key).tuning())
+
+        # verify traces
+        assert len(tuning) == len(trace_ids)
+
+        # insert
+        keys = [
+            dict(key, trace_id=t, direction=d, response=r, density=n) for t, (d, r, n) in zip(trace_ids, tuning)
+        ]
+        self.insert(keys)
+
+
 @schema.computed
 class VisualSpatialTuning:
     definition = """
@@ -101,3 +184,48 @@ class VisualSpatialTuning:
 
         # insert
         self.insert(rows)
+
+
+@schema.computed
+class VisualTracesSpatialTuning:
+    definition = """
+    -> TraceSet
+    -> TrialFilterSet
+    -> stimulus.VideoSet
+    -> utility.Offset
+    -> utility.Impulse
+    -> utility.Resolution
+    -> Trace
+    spatial_type            : varchar(128)      # spatial type
+    ---
+    response                : longblob         # response (STA) to spatial locations -- 2D array
+    density                 : longblob         # density of spatial locations -- 2D array
+    """
+
+    @property
+    def key_source(self):
+        from foundation.recording.compute.visual import VisualTracesSpatialTuning
+
+        return VisualTracesSpatialTuning.key_source
+
+    def make(self, key):
+        from foundation.recording.compute.visual import VisualTracesSpatialTuning
+
+        # trace ids
+        trace_ids = (TraceSet & key).members.fetch("trace_id", order_by="traceset_index")
+
+        # spatial tuning
+        for spatial_type, response, density in (VisualTracesSpatialTuning & key).tuning():
+
+            # verify traces
+            assert len(response) == len(density) == len(trace_ids)
+
+            # create keys, skipping traces with no valid responses
+            keys = [
+                dict(key, trace_id=t, spatial_type=spatial_type, response=r, density=d)
+                for t, r, d in zip(trace_ids, response, density)
+                if d.any()
+            ]
+
+            # insert
+            self.insert(keys)
@@ -1,7 +1,7 @@
 import numpy as np
 from djutils import rowproperty, keys
 
-from foundation.virtual import recording, fnn, tuning
+from foundation.virtual import utility, recording, fnn, tuning
 
 
 # ----------------------------- Direction Tuning -----------------------------
@@ -24,6 +24,18 @@ class DirectionType:
         """
         raise NotImplementedError()
 
+    @rowproperty
+    def events(self):
+        """
+        Returns
+        -------
+        1D array
+            [events] -- discretized directions (degrees)
+        1D array
+            [events] -- responses to directions
+        """
+        raise NotImplementedError()
+
 
 # -- Direction Tuning Types --
 
@@ -42,6 +54,40 @@ class RecordingVisualDirection(DirectionType):
     def tuning(self):
         return (recording.VisualDirectionTuning & self.item).fetch1("direction", "response")
 
+    @rowproperty
+    def events(self):
+        from foundation.recording.compute.visual import VisualDirectionTuning
+
+        return (VisualDirectionTuning & self.item).events
+
+
+@keys
+class RecordingVisualTracesDirection(DirectionType):
+    """Recording Visual Direction Tuning -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.VisualTracesDirectionTuning,
+        ]
+
+    @rowproperty
+    def tuning(self):
+        return (recording.VisualTracesDirectionTuning & self.item).fetch1("direction", "response")
+
+    @rowproperty
+    def events(self):
+        from foundation.recording.compute.visual import VisualTracesDirectionTuning
+        from foundation.recording.trace import TraceSet
+
+        # trace index
+        index = ((TraceSet & self.item).members & self.item).fetch1("traceset_index")
+
+        # trace set events
+        directions, responses = (VisualTracesDirectionTuning & self.item).events
+
+        return directions, responses[:, index]
+
 
 @keys
 class FnnVisualDirection(DirectionType):
@@ -57,6 +103,158 @@ class FnnVisualDirection(DirectionType):
     def tuning(self):
         return (fnn.VisualDirectionTuning & self.item).fetch1("direction", "response")
 
+    @rowproperty
+    def events(self):
+        from foundation.fnn.compute.visual import VisualDirectionTuning
+
+        # model events
+        directions, responses = (VisualDirectionTuning & self.item).events
+
+        return directions, responses[:, self.item["unit"]]
+
+
+# -- Direction Tunings --
+
+
+@keys
+class Directions:
+    """Direction Tunings"""
+
+    @property
+    def keys(self):
+        return [
+            tuning.Direction,
+        ]
+
+    @property
+    def tunings(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.direction.Direction)
+        List[1D array]
+            presented directions (degrees)
+        List[1D array]
+            response to directions
+        """
+        direction_ids, directions, responses = [], [], []
+
+        for part, table in [
+            [tuning.Direction.RecordingVisualDirection, recording.VisualDirectionTuning],
+            [tuning.Direction.FnnVisualDirection, fnn.VisualDirectionTuning],
+            [tuning.Direction.RecordingVisualTracesDirection, recording.VisualTracesDirectionTuning],
+        ]:
+            # tuning curves of direction type, fetched in one query
+            rows = (part & self.key) * table
+            _ids, _directions, _responses = rows.fetch("direction_id", "direction", "response")
+
+            direction_ids.extend(_ids)
+            directions.extend(_directions)
+            responses.extend(_responses)
+
+        return direction_ids, directions, responses
+
+    def events(self):
+        """
+        Yields
+        ------
+        List[str]
+            keys (foundation.tuning.direction.Direction)
+        1D array
+            [events] -- discretized directions (degrees)
+        2D array
+            [events, keys] -- responses to directions
+        """
+        from foundation.recording.compute.visual import VisualDirectionTuning as RecordingDirection
+        from foundation.recording.compute.visual import VisualTracesDirectionTuning as RecordingTracesDirection
+        from foundation.fnn.compute.visual import VisualDirectionTuning as FnnDirection
+        from foundation.recording.trace import TraceSet
+
+        # single traces
+        for key in (tuning.Direction.RecordingVisualDirection & self.key).fetch(as_dict=True):
+
+            directions, responses = (RecordingDirection & key).events
+
+            yield [key["direction_id"]], directions, responses[:, None]
+
+        # trace sets, events are computed once per set
+        rows = tuning.Direction.RecordingVisualTracesDirection & self.key
+        for key in (RecordingTracesDirection & rows).key.fetch("KEY"):
+
+            members = (TraceSet & key).members.proj("traceset_index")
+            direction_ids, index = (rows * members & key).fetch("direction_id", "traceset_index")
+
+            directions, responses = (RecordingTracesDirection & key).events
+
+            yield list(direction_ids), directions, responses[:, index]
+
+        # models, events are computed once per model
+        rows = tuning.Direction.FnnVisualDirection & self.key
+        for key in (FnnDirection & rows).key.fetch("KEY"):
+
+            direction_ids, units = (rows & key).fetch("direction_id", "unit")
+
+            directions, responses = (FnnDirection & key).events
+
+            yield list(direction_ids), directions, responses[:, units]
+
+    def global_osi(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.direction.Direction)
+        1D array
+            global orientation selectivity indices
+        """
+        from foundation.utils.tuning import stacks
+
+        direction_ids, directions, responses = self.tunings
+        osi = np.empty(len(direction_ids))
+
+        for index, direction, response in stacks(directions, responses):
+            osi[index] = global_osi(direction, response)
+
+        return direction_ids, osi
+
+    def global_dsi(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.direction.Direction)
+        1D array
+            global direction selectivity indices
+        """
+        from foundation.utils.tuning import stacks
+
+        direction_ids, directions, responses = self.tunings
+        dsi = np.empty(len(direction_ids))
+
+        for index, direction, response in stacks(directions, responses):
+            dsi[index] = global_dsi(direction, response)
+
+        return direction_ids, dsi
+
+    def bi_von_mises(self, processes=None):
+        """
+        Parameters
+        ----------
+        processes : int | None
+            number of processes for fitting unconverged tuning curves individually
+
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.direction.Direction)
+        List[dict[str, bool | float]]
+            bi von mises parameters
+        """
+        direction_ids, directions, responses = self.tunings
+
+        return direction_ids, fit_bi_von_mises_batch(directions, responses, processes=processes)
+
 
 # ----------------------------- Direction Fit -----------------------------
 
@@ -76,6 +274,353 @@ def bi_von_mises(x, mu, kappa, phi, amp):
     return a + b
 
 
+def _result(success, mu, kappa, phi, amp, bias, mse):
+    result = {
+        "success": bool(success),
+        "kappa": float(kappa),
+        "scale": float(amp),
+        "bias": float(bias),
+        "mse": float(mse),
+    }
+    if phi > 0.5:
+        result["mu"] = float(mu % (2 * np.pi))
+        result["phi"] = float(phi)
+    else:
+        result["mu"] = float((mu + np.pi) % (2 * np.pi))
+        result["phi"] = float(1 - phi)
+    return result
+
+
+def fit_bi_von_mises(direction, response):
+    """Fits two von Mises distributions separated by pi, plus a uniform distribution, with lmfit
+
+    Parameters
+    ----------
+    direction : 1D array
+        presented directions (degrees)
+    response : 1D array
+        response to directions
+
+    Returns
+    -------
+    dict[str, bool | float]
+        bi von mises parameters
+    """
+    from lmfit import Model
+
+    x = direction / 180 * np.pi
+    mu = x[response.argmax()]
+    rmin = response.min()
+    rmax = response.max()
+    u_amp = np.maximum(rmin, rmax / 100)
+    g_amp = (rmax - u_amp) * 2
+
+    b = Model(bi_von_mises, independent_vars=["x"], prefix="g_")
+    u = Model(uniform, independent_vars=["x"], prefix="u_")
+    model = b + u
+
+    params = model.make_params(
+        g_mu=mu,
+        g_kappa=1,
+        g_phi=0.5,
+        g_amp=g_amp,
+        u_amp=u_amp,
+    )
+    params["g_phi"].set(min=0, max=1)
+    params["g_kappa"].set(min=0)
+    params["g_amp"].set(min=0)
+    params["u_amp"].set(min=0)
+
+    fit = model.fit(response, params, x=x)
+
+    return _result(
+        success=fit.success,
+        mu=fit.params["g_mu"].value,
+        kappa=fit.params["g_kappa"].value,
+        phi=fit.params["g_phi"].value,
+        amp=fit.params["g_amp"].value,
+        bias=fit.params["u_amp"].value,
+        mse=fit.chisqr / fit.ndata,
+    )
+
+
+def _external(u):
+    """Internal (unbounded) -> external (bounded) parameters, same transforms as lmfit
+
+    Parameters
+    ----------
+    u : 2D array
+        [curves, 5] -- internal mu, kappa, phi, amp, bias
+
+    Returns
+    -------
+    2D array
+        [curves, 5] -- external mu, kappa, phi, amp, bias
+    2D array
+        [curves, 5] -- derivatives of external w.r.t. internal parameters
+    """
+    p = np.empty_like(u)
+    d = np.empty_like(u)
+
+    # mu -- unbounded
+    p[:, 0] = u[:, 0]
+    d[:, 0] = 1
+
+    # kappa, amp, bias -- min=0
+    for i in [1, 3, 4]:
+        r = np.sqrt(u[:, i] ** 2 + 1)
+        p[:, i] = r - 1
+        d[:, i] = u[:, i] / r
+
+    # phi -- min=0, max=1
+    p[:, 2] = (np.sin(u[:, 2]) + 1) / 2
+    d[:, 2] = np.cos(u[:, 2]) / 2
+
+    return p, d
+
+
+def _internal(p):
+    """External (bounded) -> internal (unbounded) parameters, same transforms as lmfit
+
+    Parameters
+    ----------
+    p : 2D array
+        [curves, 5] -- external mu, kappa, phi, amp, bias
+
+    Returns
+    -------
+    2D array
+        [curves, 5] -- internal mu, kappa, phi, amp, bias
+    """
+    u = np.empty_like(p)
+    u[:, 0] = p[:, 0]
+    for i in [1, 3, 4]:
+        u[:, i] = np.sqrt((np.maximum(p[:, i], 0) + 1) ** 2 - 1)
+    u[:, 2] = np.arcsin(np.clip(p[:, 2], 0, 1) * 2 - 1)
+    return u
+
+
+def _residuals(u, x, y, w):
+    """
+    Parameters
+    ----------
+    u : 2D array
+        [curves, 5] -- internal parameters
+    x : 2D array
+        [curves, samples] -- directions (radians)
+    y : 2D array
+        [curves, samples] -- responses
+    w : 2D array
+        [curves, samples] -- sample weights (0 for padding)
+
+    Returns
+    -------
+    2D array
+        [curves, samples] -- weighted residuals
+    3D array
+        [curves, samples, 5] -- jacobian of weighted residuals w.r.t. internal parameters
+    """
+    p, d = _external(u)
+    mu, kappa, phi, amp, bias = [p[:, [i]] for i in range(5)]
+
+    c = np.cos(x - mu)
+    s = np.sin(x - mu)
+    e1 = np.exp(kappa * (c - 1))
+    e2 = np.exp(kappa * (-c - 1))
+
+    h = phi * e1 + (1 - phi) * e2
+    f = amp * h + bias
+
+    j = np.stack(
+        [
+            amp * kappa * s * (phi * e1 - (1 - phi) * e2),
+            amp * (phi * e1 * (c - 1) + (1 - phi) * e2 * (-c - 1)),
+            amp * (e1 - e2),
+            h,
+            np.ones_like(h),
+        ],
+        axis=-1,
+    )
+    j = j * d[:, None, :] * w[..., None]
+
+    return (f - y) * w, j
+
+
+def _initialize(x, y, w, kappas=(0.5, 1, 2, 4, 8), phis=(0.5, 0.75, 0.9)):
+    """Grid search initialization, with amplitude and bias solved by linear least squares
+
+    Parameters
+    ----------
+    x : 2D array
+        [curves, samples] -- directions (radians)
+    y : 2D array
+        [curves, samples] -- responses
+    w : 2D array
+        [curves, samples] -- sample weights (0 for padding)
+    kappas : Sequence[float]
+        kappa grid
+    phis : Sequence[float]
+        phi grid
+
+    Returns
+    -------
+    2D array
+        [curves, 5] -- external mu, kappa, phi, amp, bias
+    """
+    curves, samples = x.shape
+
+    # candidate mu, kappa, phi -- [curves, candidates]
+    index, kappa, phi = [_.ravel() for _ in np.meshgrid(np.arange(samples), kappas, phis, indexing="ij")]
+    mu = x[:, index]
+    kappa = np.broadcast_to(kappa, mu.shape)
+    phi = np.broadcast_to(phi, mu.shape)
+    valid = w[:, index] > 0
+
+    # candidate basis -- [curves, candidates, samples]
+    c = np.cos(x[:, None, :] - mu[..., None])
+    h = phi[..., None] * np.exp(kappa[..., None] * (c - 1))
+    h = h + (1 - phi[..., None]) * np.exp(kappa[..., None] * (-c - 1))
+
+    # weighted sums -- [curves, candidates]
+    _w = w[:, None, :]
+    _y = y[:, None, :]
+    sw = w.sum(axis=1, keepdims=True)
+    sy = (w * y).sum(axis=1, keepdims=True)
+    sh = (_w * h).sum(axis=2)
+    shh = (_w * h * h).sum(axis=2)
+    shy = (_w * h * _y).sum(axis=2)
+
+    # linear least squares, amp >= 0, bias >= 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amp = (sw * shy - sh * sy) / (sw * shh - sh**2)
+        bias = (sy - amp * sh) / sw
+
+        neg_amp = ~(amp >= 0)
+        amp = np.where(neg_amp, 0, amp)
+        bias = np.where(neg_amp, sy / sw, bias)
+
+        neg_bias = bias < 0
+        amp = np.where(neg_bias, np.maximum(shy / shh, 0), amp)
+        bias = np.where(neg_bias, 0, bias)
+
+    # sum of squared errors -- [curves, candidates]
+    sse = (_w * (amp[..., None] * h + bias[..., None] - _y) ** 2).sum(axis=2)
+    sse = np.where(valid & np.isfinite(sse), sse, np.inf)
+
+    # best candidate
+    i = np.arange(curves)
+    j = sse.argmin(axis=1)
+
+    # keep amp and bias away from their bounds, where lmfit transforms have zero gradient
+    scale = np.abs(y * w).max(axis=1)
+    floor = np.maximum(scale, np.finfo(float).eps) / 100
+    amp = np.maximum(amp[i, j], floor)
+    bias = np.maximum(bias[i, j], floor)
+
+    return np.stack([mu[i, j], kappa[i, j], phi[i, j], amp, bias], axis=1)
+
+
+def fit_bi_von_mises_batch(directions, responses, chunksize=1024, processes=None):
+    """Fits many bi von mises tuning curves at once -- same parameterization and bounds as `fit_bi_von_mises`
+
+    Parameters
+    ----------
+    directions : Sequence[1D array]
+        presented directions (degrees) of each tuning curve
+    responses : Sequence[1D array]
+        response to directions of each tuning curve
+    chunksize : int
+        number of tuning curves fitted at once
+    processes : int | None
+        number of processes for fitting unconverged tuning curves with `fit_bi_von_mises`
+
+    Returns
+    -------
+    List[dict[str, bool | float]]
+        bi von mises parameters of each tuning curve
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from foundation.utils.optimize import levenberg_marquardt
+
+    results = [None] * len(directions)
+    failed = []
+
+    for start in range(0, len(directions), chunksize):
+
+        # padded tuning curves -- [curves, samples]
+        index = range(start, min(start + chunksize, len(directions)))
+        samples = max(len(directions[i]) for i in index)
+        x = np.zeros([len(index), samples])
+        y = np.zeros([len(index), samples])
+        w = np.zeros([len(index), samples])
+
+        for k, i in enumerate(index):
+            n = len(directions[i])
+            x[k, :n] = np.asarray(directions[i], dtype=float) / 180 * np.pi
+            y[k, :n] = responses[i]
+            w[k, :n] = 1
+
+        # initialize and optimize
+        u = _internal(_initialize(x, y, w))
+        u, cost, converged = levenberg_marquardt(_residuals, u, x, y, w)
+        p, _ = _external(u)
+
+        for k, i in enumerate(index):
+            if converged[k] and np.isfinite(p[k]).all():
+                results[i] = _result(True, *p[k], mse=cost[k] / w[k].sum())
+            else:
+                failed.append(i)
+
+    # fallback for unconverged tuning curves
+    if failed:
+        with ProcessPoolExecutor(processes) as executor:
+            args = [directions[i] for i in failed], [responses[i] for i in failed]
+            for i, result in zip(failed, executor.map(fit_bi_von_mises, *args)):
+                results[i] = result
+
+    return results
+
+
+def global_osi(direction, response):
+    """
+    Parameters
+    ----------
+    direction : ND array
+        [..., directions] -- presented directions (degrees)
+    response : ND array
+        [..., directions] -- response to directions
+
+    Returns
+    -------
+    float | (N-1)D array
+        [...] -- global orientation selectivity index
+    """
+    f1 = (np.exp(direction / 90 * np.pi * 1j) * response).sum(axis=-1)
+    f0 = response.sum(axis=-1)
+
+    return np.abs(f1) / f0
+
+
+def global_dsi(direction, response):
+    """
+    Parameters
+    ----------
+    direction : ND array
+        [..., directions] -- presented directions (degrees)
+    response : ND array
+        [..., directions] -- response to directions
+
+    Returns
+    -------
+    float | (N-1)D array
+        [...] -- global direction selectivity index
+    """
+    f1 = (np.exp(direction / 180 * np.pi * 1j) * response).sum(axis=-1)
+    f0 = response.sum(axis=-1)
+
+    return np.abs(f1) / f0
+
+
 @keys
 class GlobalOSI:
     """Global Orientation Selectivity Index"""
@@ -98,10 +643,7 @@ class GlobalOSI:
 
         direction, response = (Direction & self.item).link.compute.tuning
 
-        f1 = (np.exp(direction / 90 * np.pi * 1j) * response).sum()
-        f0 = response.sum()
-
-        return np.abs(f1) / f0
+        return global_osi(direction, response)
 
 
 @keys
@@ -115,7 +657,7 @@ class GlobalDSI:
         ]
 
     @rowproperty
-    def global_osi(self):
+    def global_dsi(self):
         """
         Returns
         -------
@@ -126,10 +668,71 @@ class GlobalDSI:
 
         direction, response = (Direction & self.item).link.compute.tuning
 
-        f1 = (np.exp(direction / 180 * np.pi * 1j) * response).sum()
-        f0 = response.sum()
+        return global_dsi(direction, response)
+
+
+@keys
+class GlobalOSIPermutation:
+    """Global Orientation Selectivity Index -- Permutation Test"""
+
+    @property
+    def keys(self):
+        return [
+            tuning.Direction,
+            utility.Permutation,
+        ]
+
+    @rowproperty
+    def p_value(self):
+        """
+        Returns
+        -------
+        float
+            p-value of the global orientation selectivity index
+        """
+        from foundation.tuning.direction import Direction
+        from foundation.utility.stat import Permutation
+        from foundation.utils.significance import pvalue
+        from foundation.utils.tuning import global_selectivity
+
+        directions, responses = (Direction & self.item).link.compute.events
+        samples, seed = (Permutation & self.item).fetch1("samples", "seed")
+
+        observed, null = global_selectivity(directions, responses[:, None], 180, samples, seed)
+
+        return pvalue(observed[0], null[:, 0])
+
+
+@keys
+class GlobalDSIPermutation:
+    """Global Direction Selectivity Index -- Permutation Test"""
+
+    @property
+    def keys(self):
+        return [
+            tuning.Direction,
+            utility.Permutation,
+        ]
+
+    @rowproperty
+    def p_value(self):
+        """
+        Returns
+        -------
+        float
+            p-value of the global direction selectivity index
+        """
+        from foundation.tuning.direction import Direction
+        from foundation.utility.stat import Permutation
+        from foundation.utils.significance import pvalue
+        from foundation.utils.tuning import global_selectivity
+
+        directions, responses = (Direction & self.item).link.compute.events
+        samples, seed = (Permutation & self.item).fetch1("samples", "seed")
+
+        observed, null = global_selectivity(directions, responses[:, None], 360, samples, seed)
 
-        return np.abs(f1) / f0
+        return pvalue(observed[0], null[:, 0])
 
 
 @keys
@@ -151,51 +754,7 @@ class BiVonMises:
             bi von mises parameters
         """
         from foundation.tuning.direction import Direction
-        from lmfit import Model
 
         direction, response = (Direction & self.item).link.compute.tuning
 
-        x = direction / 180 * np.pi
-        mu = x[response.argmax()]
-        rmin = response.min()
-        rmax = response.max()
-        u_amp = np.maximum(rmin, rmax / 100)
-        g_amp = (rmax - u_amp) * 2
-
-        b = Model(bi_von_mises, independent_vars=["x"], prefix="g_")
-        u = Model(uniform, independent_vars=["x"], prefix="u_")
-        model = b + u
-
-        params = model.make_params(
-            g_mu=mu,
-            g_kappa=1,
-            g_phi=0.5,
-            g_amp=g_amp,
-            u_amp=u_amp,
-        )
-        params["g_phi"].set(min=0, max=1)
-        params["g_kappa"].set(min=0)
-        params["g_amp"].set(min=0)
-        params["u_amp"].set(min=0)
-
-        fit = model.fit(response, params, x=x)
-
-        result = {
-            "success": fit.success,
-            "kappa": fit.params["g_kappa"].value,
-            "scale": fit.params["g_amp"].value,
-            "bias": fit.params["u_amp"].value,
-            "mse": fit.chisqr / fit.ndata,
-        }
-
-        mu = fit.params["g_mu"].value
-        phi = fit.params["g_phi"].value
-
-        if phi > 0.5:
-            result["mu"] = mu % (2 * np.pi)
-            result["phi"] = phi
-        else:
-            result["mu"] = (mu + np.pi) % (2 * np.pi)
-            result["phi"] = 1 - phi
-
-        return result
+        return fit_bi_von_mises(direction, response)
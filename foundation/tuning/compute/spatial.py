@@ -41,6 +41,21 @@ class RecordingVisualSpatial(SpatialType):
         return (recording.VisualSpatialTuning & self.item).fetch1("response")
 
 
+@keys
+class RecordingVisualTracesSpatial(SpatialType):
+    """Recording Visual Spatial Tuning -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.VisualTracesSpatialTuning,
+        ]
+
+    @rowproperty
+    def tuning(self):
+        return (recording.VisualTracesSpatialTuning & self.item).fetch1("response")
+
+
 @keys
 class FnnVisualSpatial(SpatialType):
     """Fnn Visual Spatial Tuning"""
@@ -56,6 +71,85 @@ class FnnVisualSpatial(SpatialType):
         return (fnn.VisualSpatialTuning & self.item).fetch1("response")
 
 
+# -- Spatial Tunings --
+
+
+@keys
+class Spatials:
+    """Spatial Tunings"""
+
+    @property
+    def keys(self):
+        return [
+            tuning.Spatial,
+        ]
+
+    @property
+    def tunings(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.spatial.Spatial)
+        List[2D array]
+            response to spatial locations
+        """
+        spatial_ids, responses = [], []
+
+        for part, table in [
+            [tuning.Spatial.RecordingVisualSpatial, recording.VisualSpatialTuning],
+            [tuning.Spatial.FnnVisualSpatial, fnn.VisualSpatialTuning],
+            [tuning.Spatial.RecordingVisualTracesSpatial, recording.VisualTracesSpatialTuning],
+        ]:
+            # tuning of spatial type, fetched in one query
+            rows = (part & self.key) * table
+            _ids, _responses = rows.fetch("spatial_id", "response")
+
+            spatial_ids.extend(_ids)
+            responses.extend(_responses)
+
+        return spatial_ids, responses
+
+    def ssi(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.spatial.Spatial)
+        1D array
+            spatial selectivity indices
+        """
+        from foundation.utils.tuning import stacks
+
+        spatial_ids, responses = self.tunings
+        _ssi = np.empty(len(spatial_ids))
+
+        for index, response in stacks(responses):
+            _ssi[index] = ssi(response)
+
+        return spatial_ids, _ssi
+
+    def bivariate_gaussian(self):
+        """
+        Returns
+        -------
+        List[str]
+            keys (foundation.tuning.spatial.Spatial)
+        List[dict[str, bool | float | None]]
+            bivariate gaussian parameters
+        """
+        from foundation.utils.tuning import stacks
+
+        spatial_ids, responses = self.tunings
+        fits = [None] * len(spatial_ids)
+
+        for index, response in stacks(responses):
+            for i, fit in zip(index, fit_bivariate_gaussian_batch(response)):
+                fits[i] = fit
+
+        return spatial_ids, fits
+
+
 # ----------------------------- Spatial Fit -----------------------------
 
 
@@ -73,6 +167,34 @@ def meshgrid(height, width):
     return np.meshgrid(x, y, indexing="xy")
 
 
+def ssi(rf):
+    """
+    Parameters
+    ----------
+    rf : ND array
+        [..., height, width] -- response to spatial locations
+
+    Returns
+    -------
+    float | (N-2)D array
+        [...] -- spatial selectivity index
+    """
+    x, y = meshgrid(*rf.shape[-2:])
+    z = rf / rf.sum(axis=(-2, -1), keepdims=True)
+
+    mu_x = (z * x).sum(axis=(-2, -1), keepdims=True)
+    mu_y = (z * y).sum(axis=(-2, -1), keepdims=True)
+
+    _x = x - mu_x
+    _y = y - mu_y
+
+    cov_xx = (z * _x * _x).sum(axis=(-2, -1))
+    cov_xy = (z * _x * _y).sum(axis=(-2, -1))
+    cov_yy = (z * _y * _y).sum(axis=(-2, -1))
+
+    return -np.log(cov_xx * cov_yy - cov_xy**2)
+
+
 @keys
 class SSI:
     """Spatial Selectivity Index"""
@@ -95,17 +217,224 @@ class SSI:
 
         rf = (Spatial & self.item).link.compute.tuning
 
-        x, y = meshgrid(*rf.shape)
-        z = rf / rf.sum()
+        return ssi(rf)
+
+
+def _residuals(u, x, y, z, w):
+    """
+    Parameters
+    ----------
+    u : 2D array
+        [rfs, 7] -- mu_x, mu_y, log sigma_x, log sigma_y, arctanh rho, log scale, bias
+    x : 2D array
+        [rfs, locations] -- x coordinates
+    y : 2D array
+        [rfs, locations] -- y coordinates
+    z : 2D array
+        [rfs, locations] -- response to spatial locations
+    w : 2D array
+        [rfs, locations] -- location weights (0 for missing responses)
+
+    Returns
+    -------
+    2D array
+        [rfs, locations] -- weighted residuals
+    3D array
+        [rfs, locations, 7] -- jacobian of weighted residuals w.r.t. parameters
+    """
+    mu_x, mu_y, sigma_x, sigma_y, rho, scale, bias = [u[:, [i]] for i in range(7)]
+    sigma_x = np.exp(sigma_x)
+    sigma_y = np.exp(sigma_y)
+    rho = np.tanh(rho)
+    scale = np.exp(scale)
+
+    a = (x - mu_x) / sigma_x
+    b = (y - mu_y) / sigma_y
+    q = (a * a - 2 * rho * a * b + b * b) / (1 - rho**2)
+    g = np.exp(-q / 2)
+
+    # derivatives of the quadratic form w.r.t. a, b
+    dq_a = 2 * (a - rho * b) / (1 - rho**2)
+    dq_b = 2 * (b - rho * a) / (1 - rho**2)
+
+    dg = -scale * g / 2
+    j = np.stack(
+        [
+            dg * dq_a * -1 / sigma_x,
+            dg * dq_b * -1 / sigma_y,
+            dg * dq_a * -a,
+            dg * dq_b * -b,
+            dg * (2 * rho * q - 2 * a * b),
+            scale * g,
+            np.ones_like(g),
+        ],
+        axis=-1,
+    )
+    f = scale * g + bias
+
+    return (f - z) * w, j * w[..., None]
+
+
+def _initialize(x, y, z, w):
+    """Moment-based and peak-based initializations
+
+    Parameters
+    ----------
+    x : 2D array
+        [rfs, locations] -- x coordinates
+    y : 2D array
+        [rfs, locations] -- y coordinates
+    z : 2D array
+        [rfs, locations] -- response to spatial locations
+    w : 2D array
+        [rfs, locations] -- location weights (0 for missing responses)
+
+    Returns
+    -------
+    3D array
+        [2, rfs, 7] -- moment-based and peak-based starts -- mu_x, mu_y, log sigma_x, log sigma_y, arctanh rho,
+        log scale, bias
+    """
+    eps = np.finfo(float).eps
+
+    # baseline and peak
+    lo = np.nanmedian(np.where(w > 0, z, np.nan), axis=1, keepdims=True)
+    hi = np.where(w > 0, z, -np.inf).max(axis=1, keepdims=True)
+
+    # moments of the response above baseline
+    p = np.maximum(z - lo, 0) * w
+    p = p / np.maximum(p.sum(axis=1, keepdims=True), eps)
+
+    mu_x = (p * x).sum(axis=1, keepdims=True)
+    mu_y = (p * y).sum(axis=1, keepdims=True)
+
+    _x = x - mu_x
+    _y = y - mu_y
+
+    cov_xx = (p * _x * _x).sum(axis=1, keepdims=True)
+    cov_xy = (p * _x * _y).sum(axis=1, keepdims=True)
+    cov_yy = (p * _y * _y).sum(axis=1, keepdims=True)
+
+    # keep the initialization away from degenerate widths and correlations
+    floor = (x.max(axis=1, keepdims=True) + y.max(axis=1, keepdims=True)) / 100
+    sigma_x = np.maximum(np.sqrt(cov_xx), floor)
+    sigma_y = np.maximum(np.sqrt(cov_yy), floor)
+    rho = np.clip(cov_xy / (sigma_x * sigma_y), -0.9, 0.9)
+
+    # positive amplitude
+    scale = np.log(np.maximum(hi - lo, eps))
+
+    # moment-based start
+    moment = [mu_x, mu_y, np.log(sigma_x), np.log(sigma_y), np.arctanh(rho), scale, lo]
+
+    # peak-based start
+    i = np.where(w > 0, z, -np.inf).argmax(axis=1)[:, None]
+    sigma = np.log(floor * 5)
+    peak = [
+        np.take_along_axis(x, i, axis=1),
+        np.take_along_axis(y, i, axis=1),
+        sigma,
+        sigma,
+        np.zeros_like(lo),
+        scale,
+        lo,
+    ]
+    return np.stack([np.concatenate(moment, axis=1), np.concatenate(peak, axis=1)])
+
+
+def fit_bivariate_gaussian_batch(rfs, chunksize=1024):
+    """Fits a bivariate gaussian plus a uniform distribution to many equally shaped receptive fields at once
+
+    Parameters
+    ----------
+    rfs : 3D array
+        [rfs, height, width] -- response to spatial locations, nans are masked
+    chunksize : int
+        number of receptive fields fitted at once
+
+    Returns
+    -------
+    List[dict[str, bool | float | None]]
+        bivariate gaussian parameters of each receptive field -- locations in `meshgrid` coordinates. Receptive
+        fields with fewer finite locations than parameters are not fitted, and their parameters are None
+    """
+    from foundation.utils.optimize import levenberg_marquardt
+
+    n, height, width = rfs.shape
+    x, y = meshgrid(height, width)
+    x = x.ravel()
+    y = y.ravel()
+
+    keys = ["mu_x", "mu_y", "sigma_x", "sigma_y", "rho", "scale", "bias", "mse"]
+    results = [dict(success=False, **dict.fromkeys(keys)) for _ in range(n)]
+
+    # receptive fields with enough finite locations
+    z = rfs.reshape(n, height * width).astype(float)
+    w = np.isfinite(z)
+    valid = np.flatnonzero(w.sum(axis=1) >= 7)
+
+    for start in range(0, len(valid), chunksize):
+
+        index = valid[start : start + chunksize]
+        _w = w[index].astype(float)
+        _z = np.nan_to_num(z[index])
+
+        _x = np.broadcast_to(x, _z.shape)
+        _y = np.broadcast_to(y, _z.shape)
+
+        # fit from both starts, keep the better fit
+        fits = [levenberg_marquardt(_residuals, u, _x, _y, _z, _w) for u in _initialize(_x, _y, _z, _w)]
+        u, cost, converged = [np.stack(_) for _ in zip(*fits)]
+
+        i = np.where(converged, cost, np.inf).argmin(axis=0)
+        i = np.where(converged.any(axis=0), i, cost.argmin(axis=0))
+        j = np.arange(len(i))
+        u, cost, converged = u[i, j], cost[i, j], converged[i, j]
+
+        # gaussian parameters -- [rfs, 8]
+        params = np.stack(
+            [
+                u[:, 0],
+                u[:, 1],
+                np.exp(u[:, 2]),
+                np.exp(u[:, 3]),
+                np.tanh(u[:, 4]),
+                np.exp(u[:, 5]),
+                u[:, 6],
+                cost / _w.sum(axis=1),
+            ],
+            axis=1,
+        )
+        finite = np.isfinite(params).all(axis=1)
+
+        for k, _params, _converged, _finite in zip(index, params, converged, finite):
+
+            if _finite:
+                results[k] = dict(success=bool(_converged), **dict(zip(keys, _params.tolist())))
+
+    return results
 
-        mu_x = (z * x).sum()
-        mu_y = (z * y).sum()
 
-        _x = x - mu_x
-        _y = y - mu_y
+@keys
+class BivariateGaussian:
+    """Bivariate gaussian plus a uniform distribution"""
+
+    @property
+    def keys(self):
+        return [
+            tuning.Spatial,
+        ]
 
-        cov_xx = (z * _x * _x).sum()
-        cov_xy = (z * _x * _y).sum()
-        cov_yy = (z * _y * _y).sum()
+    @rowproperty
+    def bivariate_gaussian(self):
+        """
+        Returns
+        -------
+        dict[str, bool | float | None]
+            bivariate gaussian parameters
+        """
+        from foundation.tuning.spatial import Spatial
+
+        rf = (Spatial & self.item).link.compute.tuning
 
-        return -np.log(cov_xx * cov_yy - cov_xy**2)
+        return fit_bivariate_gaussian_batch(rf[None])[0]
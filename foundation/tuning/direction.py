@@ -1,5 +1,6 @@
 from djutils import rowproperty
-from foundation.virtual import recording, fnn
+from foundation.virtual import utility, recording, fnn
+from foundation.utils.batch import pending_batches
 from foundation.schemas import tuning as schema
 
 
@@ -38,6 +39,19 @@ class RecordingVisualDirection(DirectionType):
         return RecordingVisualDirection & self
 
 
+@schema.lookup
+class RecordingVisualTracesDirection(DirectionType):
+    definition = """
+    -> recording.VisualTracesDirectionTuning
+    """
+
+    @rowproperty
+    def compute(self):
+        from foundation.tuning.compute.direction import RecordingVisualTracesDirection
+
+        return RecordingVisualTracesDirection & self
+
+
 @schema.lookup
 class FnnVisualDirection(DirectionType):
     definition = """
@@ -56,7 +70,7 @@ class FnnVisualDirection(DirectionType):
 
 @schema.link
 class Direction:
-    links = [RecordingVisualDirection, FnnVisualDirection]
+    links = [RecordingVisualDirection, FnnVisualDirection, RecordingVisualTracesDirection]
     name = "direction"
     comment = "direction tuning"
 
@@ -78,6 +92,26 @@ class GlobalOSI:
         key["global_osi"] = (GlobalOSI & key).global_osi
         self.insert1(key)
 
+    @classmethod
+    def fill(cls, *restrictions, batchsize=10000):
+        """Computes pending indices in batches
+
+        Parameters
+        ----------
+        *restrictions
+            restrictions of foundation.tuning.direction.Direction
+        batchsize : int
+            number of tuning curves fetched, computed, and inserted at once
+        """
+        from foundation.tuning.compute.direction import Directions
+
+        for keys in pending_batches(Direction, cls, restrictions, batchsize):
+
+            direction_ids, global_osi = (Directions & keys).global_osi()
+
+            rows = [dict(direction_id=d, global_osi=g) for d, g in zip(direction_ids, global_osi)]
+            cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
+
 
 @schema.computed
 class GlobalDSI:
@@ -90,9 +124,121 @@ class GlobalDSI:
     def make(self, key):
         from foundation.tuning.compute.direction import GlobalDSI
 
-        key["global_dsi"] = (GlobalDSI & key).global_osi
+        key["global_dsi"] = (GlobalDSI & key).global_dsi
+        self.insert1(key)
+
+    @classmethod
+    def fill(cls, *restrictions, batchsize=10000):
+        """Computes pending indices in batches
+
+        Parameters
+        ----------
+        *restrictions
+            restrictions of foundation.tuning.direction.Direction
+        batchsize : int
+            number of tuning curves fetched, computed, and inserted at once
+        """
+        from foundation.tuning.compute.direction import Directions
+
+        for keys in pending_batches(Direction, cls, restrictions, batchsize):
+
+            direction_ids, global_dsi = (Directions & keys).global_dsi()
+
+            rows = [dict(direction_id=d, global_dsi=g) for d, g in zip(direction_ids, global_dsi)]
+            cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
+
+
+@schema.computed
+class GlobalOSIPermutation:
+    definition = """
+    -> Direction
+    -> utility.Permutation
+    ---
+    p_value = NULL  : float     # permutation p-value of the global orientation selectivity index
+    """
+
+    def make(self, key):
+        from foundation.tuning.compute.direction import GlobalOSIPermutation
+
+        key["p_value"] = (GlobalOSIPermutation & key).p_value
         self.insert1(key)
 
+    @classmethod
+    def fill(cls, key, *restrictions, batchsize=10000):
+        """Computes pending p-values in batches, permuting all tuning curves of a trace set or model at once
+
+        Parameters
+        ----------
+        key : dict[str, int]
+            key (foundation.utility.stat.Permutation)
+        *restrictions
+            restrictions of foundation.tuning.direction.Direction
+        batchsize : int
+            number of tuning curves fetched at once
+        """
+        from foundation.tuning.compute.direction import Directions
+        from foundation.utils.significance import pvalue
+        from foundation.utils.tuning import global_selectivity
+
+        pkey = (utility.Permutation & key).fetch1("KEY")
+        samples, seed = pkey["samples"], pkey["seed"]
+
+        for keys in pending_batches(Direction, cls & pkey, restrictions, batchsize):
+
+            for direction_ids, directions, responses in (Directions & keys).events():
+
+                observed, null = global_selectivity(directions, responses, 180, samples, seed)
+                p_values = pvalue(observed, null)
+
+                rows = [dict(pkey, direction_id=d, p_value=p) for d, p in zip(direction_ids, p_values)]
+                cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
+
+
+@schema.computed
+class GlobalDSIPermutation:
+    definition = """
+    -> Direction
+    -> utility.Permutation
+    ---
+    p_value = NULL  : float     # permutation p-value of the global direction selectivity index
+    """
+
+    def make(self, key):
+        from foundation.tuning.compute.direction import GlobalDSIPermutation
+
+        key["p_value"] = (GlobalDSIPermutation & key).p_value
+        self.insert1(key)
+
+    @classmethod
+    def fill(cls, key, *restrictions, batchsize=10000):
+        """Computes pending p-values in batches, permuting all tuning curves of a trace set or model at once
+
+        Parameters
+        ----------
+        key : dict[str, int]
+            key (foundation.utility.stat.Permutation)
+        *restrictions
+            restrictions of foundation.tuning.direction.Direction
+        batchsize : int
+            number of tuning curves fetched at once
+        """
+        from foundation.tuning.compute.direction import Directions
+        from foundation.utils.significance import pvalue
+        from foundation.utils.tuning import global_selectivity
+
+        pkey = (utility.Permutation & key).fetch1("KEY")
+        samples, seed = pkey["samples"], pkey["seed"]
+
+        for keys in pending_batches(Direction, cls & pkey, restrictions, batchsize):
+
+            for direction_ids, directions, responses in (Directions & keys).events():
+
+                observed, null = global_selectivity(directions, responses, 360, samples, seed)
+                p_values = pvalue(observed, null)
+
+                rows = [dict(pkey, direction_id=d, p_value=p) for d, p in zip(direction_ids, p_values)]
+                cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
+
 
 @schema.computed
 class BiVonMises:
@@ -113,3 +259,25 @@ class BiVonMises:
 
         key = dict(key, **(BiVonMises & key).bi_von_mises)
         self.insert1(key)
+
+    @classmethod
+    def fill(cls, *restrictions, batchsize=10000, processes=None):
+        """Fits pending tuning curves in batches
+
+        Parameters
+        ----------
+        *restrictions
+            restrictions of foundation.tuning.direction.Direction
+        batchsize : int
+            number of tuning curves fetched, fitted, and inserted at once
+        processes : int | None
+            number of processes for fitting unconverged tuning curves individually
+        """
+        from foundation.tuning.compute.direction import Directions
+
+        for keys in pending_batches(Direction, cls, restrictions, batchsize):
+
+            direction_ids, fits = (Directions & keys).bi_von_mises(processes=processes)
+
+            rows = [dict(direction_id=d, **f) for d, f in zip(direction_ids, fits)]
+            cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
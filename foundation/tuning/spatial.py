@@ -1,5 +1,6 @@
 from djutils import rowproperty
 from foundation.virtual import recording, fnn
+from foundation.utils.batch import pending_batches
 from foundation.schemas import tuning as schema
 
 
@@ -38,6 +39,19 @@ class RecordingVisualSpatial(SpatialType):
         return RecordingVisualSpatial & self
 
 
+@schema.lookup
+class RecordingVisualTracesSpatial(SpatialType):
+    definition = """
+    -> recording.VisualTracesSpatialTuning
+    """
+
+    @rowproperty
+    def compute(self):
+        from foundation.tuning.compute.spatial import RecordingVisualTracesSpatial
+
+        return RecordingVisualTracesSpatial & self
+
+
 @schema.lookup
 class FnnVisualSpatial(SpatialType):
     definition = """
@@ -56,7 +70,7 @@ class FnnVisualSpatial(SpatialType):
 
 @schema.link
 class Spatial:
-    links = [RecordingVisualSpatial, FnnVisualSpatial]
+    links = [RecordingVisualSpatial, FnnVisualSpatial, RecordingVisualTracesSpatial]
     name = "spatial"
     comment = "spatial tuning"
 
@@ -77,3 +91,66 @@ class SSI:
 
         key["ssi"] = (SSI & key).ssi
         self.insert1(key)
+
+    @classmethod
+    def fill(cls, *restrictions, batchsize=10000):
+        """Computes pending indices in batches
+
+        Parameters
+        ----------
+        *restrictions
+            restrictions of foundation.tuning.spatial.Spatial
+        batchsize : int
+            number of receptive fields fetched, computed, and inserted at once
+        """
+        from foundation.tuning.compute.spatial import Spatials
+
+        for keys in pending_batches(Spatial, cls, restrictions, batchsize):
+
+            spatial_ids, ssi = (Spatials & keys).ssi()
+
+            rows = [dict(spatial_id=s, ssi=v) for s, v in zip(spatial_ids, ssi)]
+            cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
+
+
+@schema.computed
+class BivariateGaussian:
+    definition = """
+    -> Spatial
+    ---
+    success             : bool      # success of least squares optimization
+    mu_x = NULL         : float     # center of the gaussian -- x coordinate
+    mu_y = NULL         : float     # center of the gaussian -- y coordinate
+    sigma_x = NULL      : float     # standard deviation of the gaussian -- x coordinate
+    sigma_y = NULL      : float     # standard deviation of the gaussian -- y coordinate
+    rho = NULL          : float     # correlation of the gaussian
+    scale = NULL        : float     # gaussian amplitude
+    bias = NULL         : float     # uniform amplitude
+    mse = NULL          : float     # mean squared error
+    """
+
+    def make(self, key):
+        from foundation.tuning.compute.spatial import BivariateGaussian
+
+        key = dict(key, **(BivariateGaussian & key).bivariate_gaussian)
+        self.insert1(key)
+
+    @classmethod
+    def fill(cls, *restrictions, batchsize=10000):
+        """Fits pending receptive fields in batches
+
+        Parameters
+        ----------
+        *restrictions
+            restrictions of foundation.tuning.spatial.Spatial
+        batchsize : int
+            number of receptive fields fetched, fitted, and inserted at once
+        """
+        from foundation.tuning.compute.spatial import Spatials
+
+        for keys in pending_batches(Spatial, cls, restrictions, batchsize):
+
+            spatial_ids, fits = (Spatials & keys).bivariate_gaussian()
+
+            rows = [dict(spatial_id=s, **f) for s, f in zip(spatial_ids, fits)]
+            cls.insert(rows, skip_duplicates=True, allow_direct_insert=True)
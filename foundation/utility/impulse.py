@@ -15,8 +15,8 @@ class ImpulseType:
         """
         Parameters
         -------
-        times : 1D array
-            trace times, monotonically increasing
+        times : 1D array | 2D array
+            trace times, monotonically increasing -- [T] | [T, N] (per-column times of 2D values)
         values : ND array
             trace values, first dim same length as times
         target_offset : float
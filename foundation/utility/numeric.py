@@ -1,3 +1,4 @@
+import numpy as np
 from djutils import rowproperty
 from foundation.schemas import utility as schema
 
@@ -20,6 +21,16 @@ class PrecisionType:
         """
         raise NotImplementedError()
 
+    @rowproperty
+    def round(self):
+        """
+        Returns
+        -------
+        Callable[[ND array], ND array]
+            float -> float, rounded to the same precision as `string`
+        """
+        raise NotImplementedError()
+
 
 # -- Precision Types --
 
@@ -36,6 +47,18 @@ class Digits(PrecisionType):
 
         return lambda x: f"{x:.{digits}f}"
 
+    @rowproperty
+    def round(self):
+        string = self.string
+
+        def _round(x):
+            x = np.asarray(x, dtype=float)
+            values, index = np.unique(x, return_inverse=True)
+            values = np.array([float(string(v)) for v in values])
+            return values[index].reshape(x.shape)
+
+        return _round
+
 
 # -- Precision --
 
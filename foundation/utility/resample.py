@@ -117,6 +117,16 @@ class ResampleType:
         """
         raise NotImplementedError()
 
+    @rowproperty
+    def precision(self):
+        """
+        Returns
+        -------
+        str | None
+            storage precision of resampled traces -- "float16" | "bfloat16" | None (original dtype)
+        """
+        return None
+
 
 # -- Resample Types --
 
@@ -157,11 +167,58 @@ class LowpassHamming(ResampleType):
         )
 
 
+@schema.lookup
+class HalfHamming(ResampleType):
+    definition = """
+    precision       : enum("float16", "bfloat16")   # storage precision of resampled traces
+    """
+
+    @rowmethod
+    def resample(self, times, values, target_period, target_offset):
+        from foundation.utils.resample import Hamming
+
+        return Hamming(
+            times=times,
+            values=values,
+            target_period=target_period,
+            target_offset=target_offset,
+        )
+
+    @rowproperty
+    def precision(self):
+        return self.fetch1("precision")
+
+
+@schema.lookup
+class HalfLowpassHamming(ResampleType):
+    definition = """
+    lowpass_hz      : decimal(6, 3)                 # lowpass filter rate
+    precision       : enum("float16", "bfloat16")   # storage precision of resampled traces
+    """
+
+    @rowmethod
+    def resample(self, times, values, target_period, target_offset):
+        from foundation.utils.resample import LowpassHamming
+
+        return LowpassHamming(
+            times=times,
+            values=values,
+            target_period=target_period,
+            lowpass_period=1 / float(self.fetch1("lowpass_hz")),
+            target_offset=target_offset,
+        )
+
+    @rowproperty
+    def precision(self):
+        return self.fetch1("precision")
+
+
 # -- Resample --
 
 
 @schema.link
 class Resample:
-    links = [Hamming, LowpassHamming]
+    links = [Hamming, LowpassHamming, HalfHamming, HalfLowpassHamming]
     name = "resample"
     comment = "resampling method"
+
@@ -46,12 +46,29 @@ class CCMax(MeasureType):
         return CCMax()
 
 
+@schema.lookup
+class CCMaxBootstrap(MeasureType):
+    definition = """
+    samples     : int unsigned      # number of bootstrap samples
+    quantile    : decimal(6, 4)     # quantile of the bootstrap distribution
+    seed        : int unsigned      # random seed
+    """
+
+    @rowproperty
+    def measure(self):
+        from foundation.utils.response import CCMax, Bootstrap
+
+        samples, quantile, seed = self.fetch1("samples", "quantile", "seed")
+
+        return Bootstrap(CCMax(), samples=samples, quantile=quantile, seed=seed)
+
+
 # -- Measure --
 
 
 @schema.link
 class Measure:
-    links = [CCMax]
+    links = [CCMax, CCMaxBootstrap]
     name = "measure"
     comment = "response measure"
 
@@ -90,11 +107,28 @@ class CCSignal(CorrelationType):
         return CCSignal()
 
 
+@schema.lookup
+class CCSignalBootstrap(CorrelationType):
+    definition = """
+    samples     : int unsigned      # number of bootstrap samples
+    quantile    : decimal(6, 4)     # quantile of the bootstrap distribution
+    seed        : int unsigned      # random seed
+    """
+
+    @rowproperty
+    def correlation(self):
+        from foundation.utils.response import CCSignal, BootstrapCorrelation
+
+        samples, quantile, seed = self.fetch1("samples", "quantile", "seed")
+
+        return BootstrapCorrelation(CCSignal(), samples=samples, quantile=quantile, seed=seed)
+
+
 # -- Correlation --
 
 
 @schema.link
 class Correlation:
-    links = [CCSignal]
+    links = [CCSignal, CCSignalBootstrap]
     name = "correlation"
     comment = "response correlation"
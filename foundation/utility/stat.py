@@ -1,5 +1,5 @@
 import numpy as np
-from djutils import rowproperty
+from djutils import rowproperty, rowmethod
 from foundation.schemas import utility as schema
 
 
@@ -21,6 +21,16 @@ class SummaryType:
         """
         raise NotImplementedError()
 
+    @rowmethod
+    def accumulator(self):
+        """
+        Returns
+        -------
+        foundation.utils.stat.Accumulator
+            streaming summary statistic, computed over the first dim of 2D arrays
+        """
+        raise NotImplementedError()
+
 
 # -- Summary Types --
 
@@ -34,6 +44,12 @@ class Minimum(SummaryType):
     def summary(self):
         return np.min
 
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Minimum
+
+        return Minimum()
+
 
 @schema.method
 class Mean(SummaryType):
@@ -44,6 +60,12 @@ class Mean(SummaryType):
     def summary(self):
         return np.mean
 
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Mean
+
+        return Mean()
+
 
 @schema.lookup
 class Std(SummaryType):
@@ -56,6 +78,12 @@ class Std(SummaryType):
         ddof = self.fetch1("ddof")
         return lambda x: np.std(x, ddof=ddof)
 
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Std
+
+        return Std(ddof=self.fetch1("ddof"))
+
 
 # -- Summary --
 
@@ -65,3 +93,14 @@ class Summary:
     links = [Minimum, Mean, Std]
     name = "summary"
     comment = "summary statistic"
+
+
+# ------------------------------------ Permutation ------------------------------------
+
+
+@schema.lookup
+class Permutation:
+    definition = """
+    samples     : int unsigned      # number of permutations
+    seed        : int unsigned      # random seed
+    """
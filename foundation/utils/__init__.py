@@ -1,4 +1,4 @@
-from .context import torch_rng, use_cuda, cuda_enabled
+from .context import torch_rng, use_cuda, cuda_enabled, shared_data_cache, pin_threads
 from .logging import get_logger, tqdm, disable_tqdm
 
 logger = get_logger()
@@ -0,0 +1,30 @@
+from .logging import tqdm
+
+
+def pending_batches(source, table, restrictions, batchsize):
+    """Batches of source keys that are pending in a table
+
+    Parameters
+    ----------
+    source : datajoint.Table
+        table of source keys
+    table : datajoint.Table
+        table that references the source table
+    restrictions : Sequence
+        restrictions of the source table
+    batchsize : int
+        batch size
+
+    Yields
+    ------
+    List[dict]
+        batch of pending keys (source table), ordered by primary key
+    """
+    keys = source.proj()
+    for restriction in restrictions:
+        keys &= restriction
+
+    keys = (keys - table).fetch("KEY", order_by=source.primary_key)
+
+    for i in tqdm(range(0, len(keys), batchsize), desc="Batches"):
+        yield keys[i : i + batchsize]
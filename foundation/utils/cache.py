@@ -0,0 +1,266 @@
+import os
+import json
+import socket
+import shutil
+import hashlib
+import numpy as np
+from uuid import uuid4
+
+
+def key_hash(key):
+    """
+    Parameters
+    ----------
+    key : dict
+        json-serializable key
+
+    Returns
+    -------
+    str
+        content address of the key
+    """
+    key = json.dumps(key, sort_keys=True, default=lambda x: x.item() if isinstance(x, np.generic) else str(x))
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+class TrialArrays:
+    """Trial Arrays -- one contiguous memory-mapped file per modality, segmented by trial, with shared sources"""
+
+    def __init__(self, directory):
+        """
+        Parameters
+        ----------
+        directory : str
+            cache directory
+        """
+        self.directory = str(directory)
+
+    @property
+    def exists(self):
+        """
+        Returns
+        -------
+        bool
+            whether the cache has been written
+        """
+        return os.path.exists(os.path.join(self.directory, "trials.npz"))
+
+    @property
+    def trial_ids(self):
+        """
+        Returns
+        -------
+        1D array
+            [N] -- dtype=str -- trial keys
+        """
+        with np.load(os.path.join(self.directory, "trials.npz")) as f:
+            return f["trial_ids"]
+
+    def save(self, trial_ids, samples, trials, sources=None):
+        """
+        Parameters
+        ----------
+        trial_ids : Sequence[str]
+            [N] -- trial keys
+        samples : Sequence[int]
+            [N] -- number of samples per trial
+        trials : Iterable[dict[str, np.ndarray | tuple[hashable, 1D array]]]
+            [N] -- modality name -> [samples, ...] trial array | (source key, [samples] source index)
+        sources : dict[str, Iterable[tuple[hashable, np.ndarray]]] | None
+            modality name -> unique (source key, [frames, ...] source array), each stored once
+        """
+        samples = np.array(samples, dtype=int)
+        offsets = np.concatenate([[0], np.cumsum(samples)])
+
+        # written to a temporary directory, then renamed into place
+        tmp = f"{self.directory}.{os.getpid()}.{socket.gethostname()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+
+        # unique sources
+        positions = dict()
+        for name, _sources in (sources or dict()).items():
+
+            positions[name] = dict()
+            for j, (key, a) in enumerate(_sources):
+                np.save(os.path.join(tmp, f"{name}.{j}.npy"), a)
+                positions[name][key] = j
+
+        # trial arrays
+        memmaps, source_ids, i = dict(), {name: [] for name in positions}, -1
+
+        for i, trial in enumerate(trials):
+            for name, a in trial.items():
+
+                if name in positions:
+                    key, a = a
+                    source_ids[name].append(positions[name][key])
+
+                if name not in memmaps:
+                    shape = (int(offsets[-1]), *a.shape[1:])
+                    path = os.path.join(tmp, f"{name}.npy")
+                    memmaps[name] = np.lib.format.open_memmap(path, mode="w+", dtype=a.dtype, shape=shape)
+
+                assert a.shape[0] == samples[i], "Trial samples mismatch"
+                memmaps[name][offsets[i] : offsets[i + 1]] = a
+
+        assert i + 1 == samples.size, "Trial count mismatch"
+
+        for a in memmaps.values():
+            a.flush()
+
+        np.savez(
+            os.path.join(tmp, "trials.npz"),
+            trial_ids=np.array(trial_ids, dtype=str),
+            offsets=offsets,
+            modalities=np.array(list(memmaps), dtype=str),
+            **{f"{name}.sources": np.array(ids, dtype=int) for name, ids in source_ids.items()},
+        )
+
+        try:
+            os.rename(tmp, self.directory)
+        except OSError:
+            # written concurrently by another process
+            shutil.rmtree(tmp)
+
+    def load(self):
+        """
+        Returns
+        -------
+        1D array
+            [N] -- dtype=str -- trial keys
+        1D array
+            [N] -- dtype=int -- number of samples per trial
+        dict[str, list[np.memmap | tuple[np.memmap, np.memmap]]]
+            modality name -> [N] read-only memory-mapped [samples, ...] trial arrays
+                                | ([frames, ...] source array, [samples] source index)
+        """
+        with np.load(os.path.join(self.directory, "trials.npz")) as f:
+            trial_ids, offsets, modalities = [f[k] for k in ["trial_ids", "offsets", "modalities"]]
+            source_ids = {name: f[f"{name}.sources"] for name in modalities if f"{name}.sources" in f}
+
+        arrays = {}
+        for name in modalities:
+            a = np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode="r")
+            arrays[name] = [a[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
+
+            if name in source_ids:
+                ids = source_ids[name]
+                sources = {j: np.load(os.path.join(self.directory, f"{name}.{j}.npy"), mmap_mode="r") for j in set(ids)}
+                arrays[name] = [(sources[j], index) for j, index in zip(ids, arrays[name])]
+
+        return trial_ids, np.diff(offsets), arrays
+
+
+class TrialStore:
+    """Trial Store -- trial arrays of one content-addressed component, in append-only segments"""
+
+    def __init__(self, directory):
+        """
+        Parameters
+        ----------
+        directory : str
+            component directory
+        """
+        self.directory = str(directory)
+
+    @property
+    def segments(self):
+        """
+        Returns
+        -------
+        list[TrialArrays]
+            written segments
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        names = [_ for _ in sorted(os.listdir(self.directory)) if not _.endswith(".tmp")]
+        segments = [TrialArrays(os.path.join(self.directory, _)) for _ in names]
+        return [_ for _ in segments if _.exists]
+
+    @property
+    def trial_ids(self):
+        """
+        Returns
+        -------
+        set[str]
+            stored trial keys
+        """
+        return set().union(*(_.trial_ids for _ in self.segments))
+
+    def save(self, trial_ids, samples, trials, sources=None):
+        """Writes a new segment
+
+        Parameters
+        ----------
+        trial_ids : Sequence[str]
+            [N] -- trial keys
+        samples : Sequence[int]
+            [N] -- number of samples per trial
+        trials : Iterable[dict[str, np.ndarray | tuple[hashable, 1D array]]]
+            [N] -- modality name -> [samples, ...] trial array | (source key, [samples] source index)
+        sources : dict[str, Iterable[tuple[hashable, np.ndarray]]] | None
+            modality name -> unique (source key, [frames, ...] source array), each stored once
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.clean()
+
+        segment = TrialArrays(os.path.join(self.directory, uuid4().hex))
+        segment.save(trial_ids, samples, trials, sources)
+
+    def clean(self):
+        """Removes temporary segments left by exited processes on this host"""
+        if not os.path.isdir(self.directory):
+            return
+
+        host = socket.gethostname()
+
+        for name in os.listdir(self.directory):
+
+            if not name.endswith(".tmp"):
+                continue
+
+            # segment.pid.host.tmp
+            _, pid, _host = name[: -len(".tmp")].split(".", 2)
+
+            if _host != host:
+                continue
+
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+            except PermissionError:
+                # running under another user
+                continue
+
+    def load(self, trial_ids):
+        """
+        Parameters
+        ----------
+        trial_ids : Sequence[str]
+            [N] -- trial keys
+
+        Returns
+        -------
+        dict[str, list[np.memmap | tuple[np.memmap, np.memmap]]]
+            modality name -> [N] read-only memory-mapped trial arrays, ordered by trial_ids
+        """
+        needed, found = set(trial_ids), dict()
+
+        for segment in self.segments:
+
+            if not needed & set(segment.trial_ids):
+                continue
+
+            _trial_ids, _, arrays = segment.load()
+
+            for i, trial_id in enumerate(_trial_ids):
+                if trial_id in needed:
+                    found[trial_id] = {name: a[i] for name, a in arrays.items()}
+
+        missing = needed - set(found)
+        assert not missing, f"{len(missing)} trials missing from {self.directory}"
+
+        names = found[trial_ids[0]] if len(trial_ids) else []
+        return {name: [found[_][name] for _ in trial_ids] for name in names}
@@ -68,3 +68,48 @@ def cuda_enabled():
 
     env = os.getenv("FOUNDATION_CUDA", "-1")
     return int(env) >= 0
+
+
+@contextmanager
+def shared_data_cache():
+    """Context manager that provides a dataset cache shared by processes on this node
+
+    Uses FOUNDATION_DATA_CACHE if set, otherwise a temporary directory in shared memory that is removed on exit
+    """
+    import shutil
+    import tempfile
+
+    if os.getenv("FOUNDATION_DATA_CACHE") is not None:
+        yield
+        return
+
+    shm = "/dev/shm"
+    tmp = tempfile.mkdtemp(prefix="foundation-", dir=shm if os.path.isdir(shm) else None)
+    os.environ["FOUNDATION_DATA_CACHE"] = tmp
+
+    try:
+        yield
+    finally:
+        del os.environ["FOUNDATION_DATA_CACHE"]
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def pin_threads(rank, threads):
+    """Pins the calling process to a block of cpu cores and sets the number of torch intra-op threads
+
+    Parameters
+    ----------
+    rank : int
+        block index
+    threads : int
+        cores per block
+    """
+    import torch
+
+    cores = sorted(os.sched_getaffinity(0))
+    block = cores[rank * threads : (rank + 1) * threads]
+
+    if block:
+        os.sched_setaffinity(0, block)
+
+    torch.set_num_threads(threads)
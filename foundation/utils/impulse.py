@@ -12,20 +12,23 @@ class Impulse:
         """
         Parameters
         ----------
-        times : 1D array
-            trace times, monotonically increasing
+        times : 1D array | 2D array
+            trace times, monotonically increasing -- [T] | [T, N] (per-column times of 2D values)
         values : ND array
             trace values, first dim same length as times
         target_offset : float
             target offset
         """
-        if not times.ndim == 1:
-            raise ValueError("Times and Values must be 1D")
+        if times.ndim not in (1, 2):
+            raise ValueError("Times must be 1D or 2D")
 
-        if times.size != len(values):
+        if len(times) != len(values):
             raise ValueError("Times and Values are incompatible sizes")
 
-        if not monotonic(times):
+        if times.ndim == 2 and (values.ndim != 2 or times.shape != values.shape):
+            raise ValueError("2D Times and Values must be the same shape")
+
+        if not all(map(monotonic, times.reshape(len(times), -1).T)):
             raise ValueError("Times do not monotonically increase.")
 
         self.times = times
@@ -48,6 +51,47 @@ class Impulse:
         """
         raise NotImplementedError()
 
+    def windows(self, starts, ends):
+        """
+        Parameters
+        ----------
+        starts : 1D array
+            [E] -- target start times
+        ends : 1D array
+            [E] -- target end times
+
+        Returns
+        -------
+        ND array
+            [E, ...] -- target values
+        """
+        raise NotImplementedError()
+
+    def sweep(self, starts, ends, offsets):
+        """Evaluates the same windows shifted by many offsets at once
+
+        Parameters
+        ----------
+        starts : 1D array
+            [E] -- target start times
+        ends : 1D array
+            [E] -- target end times
+        offsets : 1D array
+            [O] -- offsets, added to the target offset
+
+        Returns
+        -------
+        ND array
+            [O, E, ...] -- target values
+        """
+        offsets = np.asarray(offsets, dtype=float)[:, None]
+        starts = (np.asarray(starts, dtype=float) + offsets).ravel()
+        ends = (np.asarray(ends, dtype=float) + offsets).ravel()
+
+        windows = self.windows(starts, ends)
+
+        return windows.reshape(len(offsets), -1, *windows.shape[1:])
+
 
 # -- Impulse Types --
 
@@ -56,8 +100,48 @@ class Box(Impulse):
     """Box Impulse"""
 
     def __call__(self, start, end):
+        if self.times.ndim == 2:
+            return self.windows(np.array([start]), np.array([end]))[0]
+
         i = np.searchsorted(self.times, self.target_offset + start, side="left")
         j = np.searchsorted(self.times, self.target_offset + end, side="right")
 
         v = self.values[i:j]
         return np.mean(v, axis=0)
+
+    def windows(self, starts, ends):
+        starts = self.target_offset + np.asarray(starts, dtype=float)
+        ends = self.target_offset + np.asarray(ends, dtype=float)
+
+        # values -- [T, N]
+        values = self.values.reshape(len(self.values), -1)
+        n = values.shape[1]
+
+        # window indices -- [E, N]
+        if self.times.ndim == 1:
+            i = np.searchsorted(self.times, starts, side="left")[:, None].repeat(n, axis=1)
+            j = np.searchsorted(self.times, ends, side="right")[:, None].repeat(n, axis=1)
+        else:
+            i = np.stack([np.searchsorted(t, starts, side="left") for t in self.times.T], axis=1)
+            j = np.stack([np.searchsorted(t, ends, side="right") for t in self.times.T], axis=1)
+
+        # cumulative sums of values and non-finite values -- [T + 1, N]
+        nans = ~np.isfinite(values)
+        csum = np.zeros([len(values) + 1, n], dtype=float)
+        cnan = np.zeros([len(values) + 1, n], dtype=int)
+        np.cumsum(np.where(nans, 0, values), axis=0, out=csum[1:])
+        np.cumsum(nans, axis=0, out=cnan[1:])
+
+        # window sums, nans, and sizes -- [E, N]
+        columns = np.arange(n)
+        sums = csum[j, columns] - csum[i, columns]
+        nans = cnan[j, columns] - cnan[i, columns]
+        size = j - i
+
+        # window means, nan if window is empty or contains non-finite values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / size
+
+        means[(nans > 0) | (size == 0)] = np.nan
+
+        return means.reshape(len(means), *self.values.shape[1:])
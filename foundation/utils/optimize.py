@@ -0,0 +1,98 @@
+import numpy as np
+
+
+# ------------------------------------ Least Squares ------------------------------------
+
+
+def levenberg_marquardt(residuals, params, *args, max_iter=1000, ftol=1.5e-8, xtol=1.5e-8, max_lam=1e16):
+    """Batched Levenberg-Marquardt -- solves many independent least squares problems at once
+
+    Parameters
+    ----------
+    residuals : Callable[[2D array, *ND array], Tuple[2D array, 3D array]]
+        (params [problems, P], *args [problems, ...]) -> residuals [problems, N], jacobian [problems, N, P]
+    params : 2D array
+        [problems, P] -- initial parameters
+    *args : ND array
+        [problems, ...] -- additional arguments to residuals
+    max_iter : int
+        maximum iterations
+    ftol : float
+        relative tolerance of the sum of squares
+    xtol : float
+        relative tolerance of the parameters
+    max_lam : float
+        maximum damping, beyond which a problem is stopped without converging
+
+    Returns
+    -------
+    2D array
+        [problems, P] -- parameters
+    1D array
+        [problems] -- sum of squared residuals
+    1D array
+        [problems] -- dtype=bool -- converged
+    """
+    u = np.array(params, dtype=float)
+    problems, p = u.shape
+    lam = np.full(problems, 1e-3)
+    converged = np.zeros(problems, dtype=bool)
+
+    r, j = residuals(u, *args)
+    cost = (r**2).sum(axis=1)
+
+    # problems with non-finite initial residuals are not optimized
+    active = np.isfinite(j).all(axis=(1, 2)) & np.isfinite(cost)
+    r[~active] = 0
+    j[~active] = 0
+
+    # parameter scaling -- running maximum of the jacobian column norms, as in MINPACK
+    scale = np.einsum("bni,bni->bi", j, j)
+
+    eye = np.eye(p)
+
+    for _ in range(max_iter):
+
+        # active problems
+        a = active.copy()
+        if not a.any():
+            break
+
+        _u, _r, _j, _lam, _cost = u[a], r[a], j[a], lam[a], cost[a]
+        _args = [arg[a] for arg in args]
+
+        # damped normal equations
+        jtj = np.einsum("bni,bnj->bij", _j, _j)
+        jtr = np.einsum("bni,bn->bi", _j, _r)
+        _scale = np.maximum(scale[a], np.diagonal(jtj, axis1=1, axis2=2))
+        damp = _lam[:, None, None] * eye * (_scale[:, None, :] + 1e-12)
+        step = -np.einsum("bij,bj->bi", np.linalg.pinv(jtj + damp), jtr)
+
+        # candidate parameters -- overflowing candidates are rejected
+        u_new = _u + step
+        with np.errstate(all="ignore"):
+            r_new, j_new = residuals(u_new, *_args)
+            cost_new = (r_new**2).sum(axis=1)
+
+        # accept improvements
+        improved = np.isfinite(j_new).all(axis=(1, 2)) & (cost_new < _cost)
+        reduction = np.where(improved, _cost - cost_new, 0)
+
+        _u[improved] = u_new[improved]
+        _r[improved] = r_new[improved]
+        _j[improved] = j_new[improved]
+        _lam = np.where(improved, _lam / 10, _lam * 10)
+
+        # convergence
+        done = improved & (reduction <= ftol * _cost)
+        done |= np.linalg.norm(step, axis=1) <= xtol * (np.linalg.norm(_u, axis=1) + xtol)
+        done |= cost_new <= np.finfo(float).tiny
+        _cost = np.where(improved, cost_new, _cost)
+
+        u[a], r[a], j[a], lam[a], cost[a], scale[a] = _u, _r, _j, _lam, _cost, _scale
+        converged[np.flatnonzero(a)[done]] = True
+
+        # stop converged and stalled problems
+        active &= ~converged & (lam <= max_lam)
+
+    return u, cost, converged
@@ -0,0 +1,122 @@
+import numpy as np
+
+
+def encode(a, precision=None):
+    """Encodes values for storage
+
+    Parameters
+    ----------
+    a : np.ndarray
+        float values
+    precision : str | None
+        "float16" | "bfloat16" | None (original dtype)
+
+    Returns
+    -------
+    np.ndarray
+        dtype=original | float16 | uint16 (bfloat16 bits)
+    """
+    if precision is None:
+        return np.asarray(a)
+
+    elif precision == "float16":
+        with np.errstate(over="ignore"):
+            return np.asarray(a).astype(np.float16)
+
+    elif precision == "bfloat16":
+        a = np.ascontiguousarray(a, dtype=np.float32)
+        bits = a.view(np.uint32).astype(np.uint64)
+
+        # round to nearest even on the upper 16 bits
+        bits = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+        bits = np.where(np.isnan(a), 0x7FC0, bits)
+
+        return bits.astype(np.uint16)
+
+    else:
+        raise ValueError(f"precision `{precision}` not recognized")
+
+
+def decode(a, dtype=None):
+    """Decodes stored values
+
+    Parameters
+    ----------
+    a : np.ndarray
+        dtype=float | uint16 (bfloat16 bits) -- encoded values
+    dtype : np.dtype | None
+        decoded dtype -- float32 for bfloat16 and the stored dtype otherwise if None
+
+    Returns
+    -------
+    np.ndarray
+        decoded values
+    """
+    if a.dtype == np.uint16:
+        a = (a.astype(np.uint32) << 16).view(np.float32)
+
+    if dtype is None:
+        return a
+
+    return a.astype(dtype, copy=False)
+
+
+class Decoded:
+    """Stored values, decoded when indexed"""
+
+    def __init__(self, a, dtype=np.float32):
+        """
+        Parameters
+        ----------
+        a : np.ndarray
+            dtype=float | uint16 (bfloat16 bits) -- encoded values, e.g. memory-mapped
+        dtype : np.dtype
+            decoded dtype
+        """
+        self.a = a
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def shape(self):
+        return self.a.shape
+
+    @property
+    def ndim(self):
+        return self.a.ndim
+
+    def __len__(self):
+        return len(self.a)
+
+    def __getitem__(self, index):
+        return decode(np.asarray(self.a[index]), self.dtype)
+
+    def __array__(self, dtype=None, copy=None):
+        return decode(np.asarray(self.a), self.dtype if dtype is None else dtype)
+
+
+def max_error(a, precision, axis=0):
+    """Maximum absolute error of the encoding
+
+    Parameters
+    ----------
+    a : np.ndarray
+        float values
+    precision : str | None
+        "float16" | "bfloat16" | None (original dtype)
+    axis : int | tuple[int]
+        axis of the reduction
+
+    Returns
+    -------
+    np.ndarray
+        maximum absolute error along axis, inf if values overflow
+    """
+    a = np.asarray(a, dtype=float)
+    b = decode(encode(a, precision), dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        error = np.abs(b - a)
+
+    error = np.where(np.isinf(b) & np.isfinite(a), np.inf, error)
+
+    return np.nanmax(error, axis=axis)
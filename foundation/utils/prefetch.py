@@ -0,0 +1,103 @@
+from collections import deque
+from itertools import islice
+from threading import Lock, local, current_thread, main_thread
+from concurrent.futures import ThreadPoolExecutor
+
+
+_local = local()
+_lock = Lock()
+_connections = dict()
+
+
+def prefetch(load, items, workers=8, depth=32):
+    """Loads items concurrently with a bounded thread pool and a bounded in-flight queue
+
+    Parameters
+    ----------
+    load : Callable[[object], object]
+        loads an item, called from worker threads
+    items : Iterable[object]
+        items to load
+    workers : int
+        number of worker threads
+    depth : int
+        maximum number of items loading or loaded ahead of the consumer
+
+    Yields
+    ------
+    object
+        loaded item, in the order of items
+    """
+    items = iter(items)
+    threads = set()
+
+    def _load(item):
+        threads.add(current_thread())
+        return load(item)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+
+            futures = deque(pool.submit(_load, item) for item in islice(items, depth))
+
+            while futures:
+                result = futures.popleft().result()
+
+                for item in islice(items, 1):
+                    futures.append(pool.submit(_load, item))
+
+                yield result
+
+    finally:
+        # workers have exited, close their connections
+        for thread in threads:
+            with _lock:
+                connection = _connections.pop(thread, None)
+
+            if connection is not None:
+                connection.close()
+
+
+def thread_module(module):
+    """Virtual module on a database connection owned by the calling thread
+
+    Parameters
+    ----------
+    module : datajoint.VirtualModule
+        virtual module, e.g. from foundation.virtual
+
+    Returns
+    -------
+    datajoint.VirtualModule
+        same schema, queried through a thread-local connection (the module itself in the main thread) --
+        the connection of a prefetch worker is closed when the worker exits
+    """
+    if current_thread() is main_thread():
+        return module
+
+    from datajoint import Connection, VirtualModule
+
+    if not hasattr(_local, "connection"):
+        from datajoint import config
+
+        # same credentials and tls setting as the parent connection
+        info = module.schema.connection.conn_info
+        _local.connection = Connection(
+            host=info["host"],
+            user=info["user"],
+            password=info["passwd"],
+            port=info["port"],
+            use_tls=info.get("ssl_input", config.get("database.use_tls")),
+        )
+        _local.modules = dict()
+
+        # closed by prefetch when the worker exits
+        with _lock:
+            _connections[current_thread()] = _local.connection
+
+    database = module.schema.database
+
+    if database not in _local.modules:
+        _local.modules[database] = VirtualModule(module.__name__, database, connection=_local.connection)
+
+    return _local.modules[database]
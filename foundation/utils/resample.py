@@ -161,6 +161,29 @@ def sample_times(start, end, period):
     return np.arange(n) * period + start
 
 
+def hamming_filter(trace, window):
+    """Filters trace with a normalized hamming window
+
+    Parameters
+    ----------
+    trace : 1D array
+        trace values, without nans
+    window : int
+        half-width of the hamming window (samples), no filtering if 0
+
+    Returns
+    -------
+    1D array
+        filtered trace values
+    """
+    if window > 0:
+        h = windows.hamming(window * 2 + 1)
+        f = h / h.sum()
+        trace = np.convolve(trace, f, mode="same")
+
+    return trace
+
+
 # ------------------------------------ Resampling Types ------------------------------------
 
 
@@ -215,6 +238,16 @@ class Resample:
     def y(self):
         return self.transform_values(self.values)
 
+    @property
+    def window(self):
+        """
+        Returns
+        -------
+        int
+            half-width of the hamming filter (source samples), 0 if unfiltered
+        """
+        return 0
+
     @property
     def kind(self):
         return "linear"
@@ -244,6 +277,27 @@ class Resample:
         end : float
             target end time
 
+        Returns
+        -------
+        1D array
+            target values
+        """
+        return self.sample(start, end, self.target_period, self.target_offset)
+
+    def sample(self, start, end, target_period, target_offset):
+        """Samples the filtered trace with any period and offset
+
+        Parameters
+        ----------
+        start : float
+            target start time
+        end : float
+            target end time
+        target_period : float
+            target sampling period
+        target_offset : float
+            target sampling offset
+
         Returns
         -------
         1D array
@@ -252,9 +306,9 @@ class Resample:
         x = sample_times(
             start=self.transform_times(start),
             end=self.transform_times(end),
-            period=self.target_period,
+            period=target_period,
         )
-        x = x + self.target_offset
+        x = x + target_offset
         y = self.transform_values(
             values=self.interp(x),
             inverse=True,
@@ -284,16 +338,15 @@ class Hamming(Resample):
     """Resample with Hamming Filtering"""
 
     @property
-    def y(self):
-        y = fill_nans(self.transform_values(self.values))
-
+    def window(self):
         if self.target_period > self.source_period:
-            r = round(self.target_period / self.source_period)
-            h = windows.hamming(r * 2 + 1)
-            f = h / h.sum()
-            y = np.convolve(y, f, mode="same")
+            return round(self.target_period / self.source_period)
+        else:
+            return 0
 
-        return y
+    @property
+    def y(self):
+        return hamming_filter(fill_nans(self.transform_values(self.values)), self.window)
 
 
 class LowpassHamming(Resample):
@@ -319,13 +372,12 @@ class LowpassHamming(Resample):
         super().__init__(times=times, values=values, target_period=target_period, target_offset=target_offset)
 
     @property
-    def y(self):
-        y = fill_nans(self.transform_values(self.values))
-
+    def window(self):
         if self.lowpass_period > self.source_period:
-            r = round(self.lowpass_period / self.source_period)
-            h = windows.hamming(r * 2 + 1)
-            f = h / h.sum()
-            y = np.convolve(y, f, mode="same")
+            return round(self.lowpass_period / self.source_period)
+        else:
+            return 0
 
-        return y
+    @property
+    def y(self):
+        return hamming_filter(fill_nans(self.transform_values(self.values)), self.window)
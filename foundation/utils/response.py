@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from scipy import stats
 from .resample import truncate
 
 
@@ -14,8 +13,8 @@ class Trials(pd.Series):
         """
         Parameters
         ----------
-        data : Sequence[1D array]
-            trial responses
+        data : Sequence[1D array | 2D array]
+            trial responses -- [samples] | [samples, units]
         index : Sequence[str] | None
             trial identifiers. optional if len(data) == 1
         tolerance : int
@@ -24,8 +23,9 @@ class Trials(pd.Series):
         # truncate trial responses to the same length
         data = truncate(*data, tolerance=tolerance)
 
-        # assert all responses are 1D
-        assert all(map(lambda x: x.ndim == 1, data)), "Each response must be 1D."
+        # assert all responses are 1D, or 2D with the same number of units
+        assert all(map(lambda x: x.ndim in (1, 2), data)), "Each response must be 1D or 2D."
+        assert len(set(map(lambda x: x.shape[1:], data))) == 1, "Responses must have the same units."
 
         # initialize
         super().__init__(data=data, index=[None] if index is None else index)
@@ -39,12 +39,12 @@ class Trials(pd.Series):
 
         Returns
         -------
-        2D array
-            [trials, samples], nan-filled to desired trial size
+        2D array | 3D array
+            [trials, samples] | [trials, samples, units], nan-filled to desired trial size
         """
-        # 2D response array
+        # response array
         array = np.stack(self.values, axis=0)
-        trials, samples = array.shape
+        trials = array.shape[0]
 
         if size is None or size == trials:
             # response array
@@ -52,7 +52,7 @@ class Trials(pd.Series):
 
         elif size > array.shape[0]:
             # nan-filled response array
-            nans = np.full([size - trials, samples], np.nan, dtype=array.dtype)
+            nans = np.full([size - trials, *array.shape[1:]], np.nan, dtype=array.dtype)
             return np.concatenate([array, nans], axis=0)
 
         else:
@@ -70,7 +70,7 @@ class Trials(pd.Series):
         bool
             whether trial identifiers and response lengths match
         """
-        return [*self.index, self.iloc[0].size] == [*other.index, other.iloc[0].size]
+        return [*self.index, self.iloc[0].shape] == [*other.index, other.iloc[0].shape]
 
 
 def concatenate(*trials, burnin=0):
@@ -84,8 +84,8 @@ def concatenate(*trials, burnin=0):
 
     Returns
     -------
-    2D array
-        [trials, samples]
+    2D array | 3D array
+        [trials, samples] | [trials, samples, units]
     """
     # max response trials
     size = max(map(len, trials))
@@ -97,6 +97,45 @@ def concatenate(*trials, burnin=0):
     return np.concatenate(arrays, axis=1)
 
 
+def pearson(x, y):
+    """Pearson correlation coefficient, computed in the same way as scipy.stats.pearsonr
+
+    Parameters
+    ----------
+    x : 1D array | 2D array
+        [samples] | [samples, units]
+    y : 1D array | 2D array
+        [samples] | [samples, units]
+
+    Returns
+    -------
+    float | 1D array
+        correlation coefficient -- [] | [units]
+    """
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same shape")
+
+    if len(x) < 2:
+        raise ValueError("x and y must have length at least 2")
+
+    # center
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xm = x - x.mean(axis=0)
+    ym = y - y.mean(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+
+        # normalize
+        xm = xm / np.linalg.norm(xm, axis=0)
+        ym = ym / np.linalg.norm(ym, axis=0)
+
+        # correlation
+        r = (xm * ym).sum(axis=0)
+
+    return np.clip(r, -1, 1)
+
+
 # ---------------------------- Response Measure ----------------------------
 
 # -- Response Measure Interface --
@@ -109,13 +148,13 @@ class Measure:
         """
         Parameters
         ----------
-        x : 2D array
-            [trials, samples]
+        x : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
 
         Returns
         -------
-        float
-            functional measure
+        float | 1D array
+            functional measure -- [] | [units]
         """
         raise NotImplementedError()
 
@@ -128,14 +167,14 @@ class CCMax(Measure):
 
     def __call__(self, x):
         # number of trials per sample
-        trials, samples = x.shape
+        trials, samples = x.shape[:2]
         t = trials - np.isnan(x).sum(axis=0)
 
         # pooled variance -> n
         v = 1 / t**2
         w = t - 1
-        z = t.sum() - samples
-        n = np.sqrt(z / (w * v).sum())
+        z = t.sum(axis=0) - samples
+        n = np.sqrt(z / (w * v).sum(axis=0))
 
         # response mean
         y_m = np.nanmean(x, axis=0)
@@ -152,6 +191,55 @@ class CCMax(Measure):
         return np.sqrt(SP / y_m_v)
 
 
+class Bootstrap(Measure):
+    """Quantile of the bootstrap distribution of a measure -- trials are resampled with replacement"""
+
+    def __init__(self, measure, samples, quantile, seed=0):
+        """
+        Parameters
+        ----------
+        measure : Measure
+            response measure
+        samples : int
+            number of bootstrap samples
+        quantile : float
+            quantile of the bootstrap distribution
+        seed : int
+            random seed
+        """
+        self.measure = measure
+        self.samples = int(samples)
+        self.quantile = float(quantile)
+        self.seed = int(seed)
+
+    def statistic(self, x):
+        """
+        Parameters
+        ----------
+        x : 3D array | 4D array
+            [resamples, trials, samples] | [resamples, trials, samples, units]
+
+        Returns
+        -------
+        1D array | 2D array
+            [resamples] | [resamples, units]
+        """
+        # fold resamples into the units axis -- [trials, samples, units * resamples]
+        x = np.moveaxis(x, 0, -1)
+        shape = x.shape[2:]
+        m = self.measure(x.reshape(*x.shape[:2], -1))
+
+        return np.moveaxis(m.reshape(shape), -1, 0)
+
+    def __call__(self, x):
+        from .significance import bootstraps, resampled
+
+        indices = bootstraps(len(x), self.samples, self.seed)
+        stats = resampled(self.statistic, indices, x)
+
+        return np.nanquantile(stats, self.quantile, axis=0)
+
+
 # ---------------------------- Response Correlation ----------------------------
 
 # -- Response Correlation Interface --
@@ -164,15 +252,15 @@ class Correlation:
         """
         Parameters
         ----------
-        x : 2D array
-            [trials, samples]
-        y : 2D array
-            [trials, samples]
+        x : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
+        y : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
 
         Returns
         -------
-        float
-            functional measure
+        float | 1D array
+            functional measure -- [] | [units]
         """
         raise NotImplementedError()
 
@@ -186,4 +274,59 @@ class CCSignal(Correlation):
     def __call__(self, x, y):
         x = np.nanmean(x, axis=0)
         y = np.nanmean(y, axis=0)
-        return stats.pearsonr(x, y)[0]
+        return pearson(x, y)
+
+
+class BootstrapCorrelation(Correlation):
+    """Quantile of the bootstrap distribution of a correlation -- trials are resampled with replacement"""
+
+    def __init__(self, correlation, samples, quantile, seed=0):
+        """
+        Parameters
+        ----------
+        correlation : Correlation
+            response correlation
+        samples : int
+            number of bootstrap samples
+        quantile : float
+            quantile of the bootstrap distribution
+        seed : int
+            random seed
+        """
+        self.correlation = correlation
+        self.samples = int(samples)
+        self.quantile = float(quantile)
+        self.seed = int(seed)
+
+    def statistic(self, x, y):
+        """
+        Parameters
+        ----------
+        x : 3D array | 4D array
+            [resamples, trials, samples] | [resamples, trials, samples, units]
+        y : 3D array | 4D array
+            [resamples, trials, samples] | [resamples, trials, samples, units]
+
+        Returns
+        -------
+        1D array | 2D array
+            [resamples] | [resamples, units]
+        """
+        # fold resamples into the units axis -- [trials, samples, units * resamples]
+        x = np.moveaxis(x, 0, -1)
+        y = np.moveaxis(y, 0, -1)
+        shape = x.shape[2:]
+        c = self.correlation(x.reshape(*x.shape[:2], -1), y.reshape(*y.shape[:2], -1))
+
+        return np.moveaxis(c.reshape(shape), -1, 0)
+
+    def __call__(self, x, y):
+        from .significance import bootstraps, resampled
+
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same number of trials")
+
+        indices = bootstraps(len(x), self.samples, self.seed)
+        stats = resampled(self.statistic, indices, x, y)
+
+        return np.nanquantile(stats, self.quantile, axis=0)
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+# ------------------------------------ Resampling ------------------------------------
+
+
+def permutations(size, samples, seed=0):
+    """Permuted indices
+
+    Parameters
+    ----------
+    size : int
+        number of observations
+    samples : int
+        number of permutations
+    seed : int
+        random seed
+
+    Returns
+    -------
+    2D array
+        [samples, size] -- dtype=int -- permuted indices
+    """
+    rng = np.random.default_rng(seed)
+    return rng.permuted(np.tile(np.arange(size), (samples, 1)), axis=1)
+
+
+def bootstraps(size, samples, seed=0):
+    """Bootstrapped indices -- sampled with replacement
+
+    Parameters
+    ----------
+    size : int
+        number of observations
+    samples : int
+        number of bootstraps
+    seed : int
+        random seed
+
+    Returns
+    -------
+    2D array
+        [samples, size] -- dtype=int -- bootstrapped indices
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, size, size=(samples, size))
+
+
+def resampled(statistic, indices, *arrays, max_bytes=2**28, overhead=0):
+    """Evaluates a statistic for many resamples at once, in chunks of bounded memory
+
+    Parameters
+    ----------
+    statistic : Callable[[*ND array], ND array]
+        (*arrays [resamples, size, ...]) -> [resamples, ...]
+    indices : 2D array
+        [samples, size] -- dtype=int -- resampled indices
+    *arrays : ND array
+        [size, ...] -- arrays to resample along the first axis
+    max_bytes : int
+        maximum size (bytes) of the resampled arrays and intermediates per chunk
+    overhead : int
+        size (bytes) of the intermediates of the statistic per resample
+
+    Returns
+    -------
+    ND array
+        [samples, ...] -- statistic of each resample
+    """
+    samples, size = indices.shape
+
+    # resamples per chunk
+    nbytes = sum(array[:1].nbytes for array in arrays) * size + overhead
+    chunksize = max(1, max_bytes // max(nbytes, 1))
+
+    stats = []
+    for i in range(0, samples, chunksize):
+        index = indices[i : i + chunksize]
+        stats.append(statistic(*(array[index] for array in arrays)))
+
+    return np.concatenate(stats, axis=0)
+
+
+def pvalue(observed, null):
+    """One-sided p-value, the probability of a null statistic at least as large as the observed statistic
+
+    Parameters
+    ----------
+    observed : float | ND array
+        [...] -- observed statistic
+    null : 1D array | (N+1)D array
+        [samples, ...] -- null distribution of the statistic
+
+    Returns
+    -------
+    float | ND array
+        [...] -- p-value, nan where the observed statistic is nan
+    """
+    p = (1 + (null >= observed).sum(axis=0)) / (1 + len(null))
+    return np.where(np.isnan(observed), np.nan, p)[()]
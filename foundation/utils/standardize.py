@@ -1,4 +1,5 @@
 import numpy as np
+from copy import copy
 
 
 # ------- Standardize Interface -------
@@ -20,7 +21,7 @@ class Standardize:
     def __len__(self):
         return self.homogeneous.size
 
-    def __call__(self, a, inverse=False):
+    def __call__(self, a, inverse=False, out=None):
         """
         Parameters
         ----------
@@ -28,6 +29,8 @@ class Standardize:
             [M, N] -- dtype=float -- values to be transformed
         inverse : bool
             inverse | normal transform
+        out : 2D array | None
+            [M, N] -- dtype=float -- output buffer written in place (may be `a`) | new array
 
         Returns
         -------
@@ -36,6 +39,28 @@ class Standardize:
         """
         raise NotImplementedError()
 
+    def permute(self, order):
+        """
+        Parameters
+        ----------
+        order : 1D array
+            [N'] -- dtype=int -- column order
+
+        Returns
+        -------
+        Standardize
+            transform with parameters in column order, i.e. `T.permute(order)(a[:, order]) == T(a)[:, order]`
+        """
+        order = np.asarray(order, dtype=int)
+        assert order.ndim == 1
+
+        permuted = copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                setattr(permuted, name, value[order])
+
+        return permuted
+
 
 # ------- Standardize Types -------
 
@@ -65,11 +90,13 @@ class Affine(Standardize):
         assert self.shift.ndim == self.scale.ndim == 1
         assert self.shift.size == self.scale.size == len(self)
 
-    def __call__(self, a, inverse=False):
+    def __call__(self, a, inverse=False, out=None):
         if inverse:
-            return a * self.scale + self.shift
+            b = np.multiply(a, self.scale, out=out)
+            return np.add(b, self.shift, out=b)
         else:
-            return (a - self.shift) / self.scale
+            b = np.subtract(a, self.shift, out=out)
+            return np.divide(b, self.scale, out=b)
 
 
 class Scale(Standardize):
@@ -94,8 +121,8 @@ class Scale(Standardize):
         assert self.scale.ndim == 1
         assert self.scale.size == len(self)
 
-    def __call__(self, a, inverse=False):
+    def __call__(self, a, inverse=False, out=None):
         if inverse:
-            return a * scale
+            return np.multiply(a, self.scale, out=out)
         else:
-            return a / self.scale
+            return np.divide(a, self.scale, out=out)
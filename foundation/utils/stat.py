@@ -0,0 +1,116 @@
+import numpy as np
+
+
+# ------- Accumulator Interface -------
+
+
+class Accumulator:
+    """Streaming Summary Statistic"""
+
+    def __init__(self):
+        self.count = 0
+
+    def update(self, a):
+        """
+        Parameters
+        ----------
+        a : 2D array
+            [M, N] -- dtype=float -- M samples of N variables
+        """
+        raise NotImplementedError()
+
+    @property
+    def result(self):
+        """
+        Returns
+        -------
+        1D array
+            [N] -- dtype=float -- summary statistic of each variable
+        """
+        raise NotImplementedError()
+
+
+# ------- Accumulator Types -------
+
+
+class Minimum(Accumulator):
+    """Streaming Minimum"""
+
+    def __init__(self):
+        super().__init__()
+        self.minimum = None
+
+    def update(self, a):
+        a = np.asarray(a)
+        if not len(a):
+            return
+
+        minimum = a.min(axis=0).astype(float)
+
+        if self.minimum is None:
+            self.minimum = minimum
+        else:
+            self.minimum = np.minimum(self.minimum, minimum)
+
+        self.count += len(a)
+
+    @property
+    def result(self):
+        if not self.count:
+            raise ValueError("Cannot summarize zero samples.")
+
+        return self.minimum
+
+
+class Mean(Accumulator):
+    """Streaming Arithmetic Mean"""
+
+    def __init__(self):
+        super().__init__()
+        self.mean = 0
+        self.m2 = 0
+
+    def update(self, a):
+        a = np.asarray(a, dtype=float)
+        if not len(a):
+            return
+
+        # batch moments
+        n = len(a)
+        mean = a.mean(axis=0)
+        m2 = np.square(a - mean).sum(axis=0)
+
+        # pairwise update -- Chan et al.
+        count = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n / count)
+        self.m2 = self.m2 + m2 + np.square(delta) * (self.count * n / count)
+        self.count = count
+
+    @property
+    def result(self):
+        if not self.count:
+            raise ValueError("Cannot summarize zero samples.")
+
+        return self.mean
+
+
+class Std(Mean):
+    """Streaming Standard Deviation"""
+
+    def __init__(self, ddof=0):
+        """
+        Parameters
+        ----------
+        ddof : int
+            delta degrees of freedom
+        """
+        super().__init__()
+        self.ddof = int(ddof)
+
+    @property
+    def result(self):
+        if not self.count:
+            raise ValueError("Cannot summarize zero samples.")
+
+        return np.sqrt(self.m2 / (self.count - self.ddof))
@@ -0,0 +1,206 @@
+import numpy as np
+
+
+# ------------------------------------ Spatial Tuning ------------------------------------
+
+
+def spatial_sta(grids, responses):
+    """Spatial spike-triggered average, computed as matrix products over events
+
+    Parameters
+    ----------
+    grids : 3D array
+        [events, height, width] -- spatial grids
+    responses : 2D array
+        [events, units] -- responses, nans are masked
+
+    Returns
+    -------
+    3D array
+        [units, height, width] -- dtype=np.float32 -- response (STA) to spatial locations
+    3D array
+        [units, height, width] -- dtype=np.float32 -- density of spatial locations
+    """
+    events, height, width = grids.shape
+    _events, units = responses.shape
+
+    if events != _events:
+        raise ValueError("Grids and Responses have a different number of events")
+
+    # [height * width, events]
+    grids = np.asarray(grids, dtype=float).reshape(events, height * width).T
+
+    # masked responses -- [events, units]
+    masks = np.isfinite(responses)
+    responses = np.where(masks, responses, 0)
+
+    # density of spatial locations -- [height * width, units]
+    if masks.all():
+        density = np.broadcast_to(grids.sum(axis=1, keepdims=True), [height * width, units])
+    else:
+        density = grids @ masks.astype(float)
+
+    # response to spatial locations -- [height * width, units]
+    sta = grids @ responses
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sta /= density
+
+    # [units, height, width]
+    sta = sta.T.astype(np.float32).reshape(units, height, width)
+    density = density.T.astype(np.float32).reshape(units, height, width)
+
+    return sta, density
+
+
+# ------------------------------------ Direction Tuning ------------------------------------
+
+
+def direction_sta(directions, responses):
+    """Direction spike-triggered average, computed with bincounts over direction bins
+
+    Parameters
+    ----------
+    directions : 1D array
+        [events] -- discretized directions (degrees)
+    responses : 2D array
+        [events, units] -- responses, nans are masked
+
+    Returns
+    -------
+    1D array
+        [directions] -- presented directions (degrees, sorted)
+    2D array
+        [units, directions] -- response (STA) to directions
+    2D array
+        [units, directions] -- dtype=int -- density of directions
+    """
+    events, units = responses.shape
+
+    if len(directions) != events:
+        raise ValueError("Directions and Responses have a different number of events")
+
+    # direction bins -- [events]
+    bins, index = np.unique(directions, return_inverse=True)
+    index = index.reshape(events)
+
+    # masked responses -- [events, units]
+    masks = np.isfinite(responses)
+    responses = np.where(masks, responses, 0)
+
+    # flat (direction, unit) index -- [events, units]
+    index = index[:, None] * units + np.arange(units)
+    size = bins.size * units
+
+    # response sums and density -- [directions, units]
+    sums = np.bincount(index.ravel(), weights=responses.ravel(), minlength=size).reshape(bins.size, units)
+    density = np.bincount(index.ravel(), weights=masks.ravel(), minlength=size).reshape(bins.size, units)
+    density = density.astype(int)
+
+    # response means
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sta = sums / density
+
+    return bins, sta.T, density.T
+
+
+def global_selectivity(directions, responses, period, samples, seed=0, max_bytes=2**28):
+    """Global selectivity index, and its null distribution under permutations of directions across events
+
+    Parameters
+    ----------
+    directions : 1D array
+        [events] -- discretized directions (degrees)
+    responses : 2D array
+        [events, units] -- responses, nans are masked
+    period : float
+        period of selectivity (degrees) -- 180 for orientation, 360 for direction
+    samples : int
+        number of permutations
+    seed : int
+        random seed
+    max_bytes : int
+        maximum size (bytes) of the permuted directions and intermediates per chunk
+
+    Returns
+    -------
+    1D array
+        [units] -- global selectivity index
+    2D array
+        [samples, units] -- null distribution of the global selectivity index
+    """
+    from .significance import permutations, resampled
+
+    events, units = responses.shape
+
+    if len(directions) != events:
+        raise ValueError("Directions and Responses have a different number of events")
+
+    # one-hot direction bins -- [events, directions]
+    bins, index = np.unique(directions, return_inverse=True)
+    onehot = np.eye(bins.size)[index.reshape(events)]
+
+    # masked responses -- [events, units]
+    masks = np.isfinite(responses).astype(float)
+    responses = np.where(masks > 0, responses, 0)
+
+    # selectivity phases -- [directions]
+    phases = np.exp(bins / period * 2j * np.pi)
+
+    def statistic(onehot):
+        # response sums and density -- [resamples, directions, units]
+        onehot = onehot.transpose(0, 2, 1)
+        sums = onehot @ responses
+        density = onehot @ masks
+
+        # response means, directions without responses are dropped
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sta = np.where(density > 0, sums / density, 0)
+
+        # global selectivity index -- [resamples, units]
+        return np.abs(np.einsum("d,rdu->ru", phases, sta)) / sta.sum(axis=1)
+
+    # observed and null selectivity
+    observed = statistic(onehot[None])[0]
+    # float intermediates of the statistic per resample -- sums, density, sta, quotient -- [directions, units]
+    overhead = 4 * bins.size * units * np.dtype(float).itemsize
+
+    null = resampled(
+        statistic,
+        permutations(events, samples, seed),
+        onehot,
+        max_bytes=max_bytes,
+        overhead=overhead,
+    )
+
+    return observed, null
+
+
+# ------------------------------------ Batching ------------------------------------
+
+
+def stacks(*arrays):
+    """Stacks equally shaped arrays
+
+    Parameters
+    ----------
+    *arrays : Sequence[ND array]
+        sequences of arrays, all of the same length
+
+    Yields
+    ------
+    1D array
+        [stack] -- dtype=int -- indices of the stacked arrays
+    *(N+1)D array
+        [stack, ...] -- stacked arrays, one for each sequence
+    """
+    if len(set(map(len, arrays))) > 1:
+        raise ValueError("Sequences have different lengths")
+
+    groups = dict()
+    for i, a in enumerate(zip(*arrays)):
+        shape = tuple(np.shape(_) for _ in a)
+        groups.setdefault(shape, []).append(i)
+
+    for index in groups.values():
+        yield (np.array(index), *(np.stack([array[i] for i in index]) for array in arrays))